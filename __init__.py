@@ -28,9 +28,25 @@ __version__ = "1.0.0"
 __author__ = "AI Agents Swarm"
 __description__ = "Minimalist AI automation system for solo developers"
 
-# Import main components for easy access
-from agents.core import BaseAgent, Task, TaskPriority, TaskStatus
-from agents.main import AgentOrchestrator
+# Main components are resolved on first access (PEP 562) so importing the
+# package does not pull in the AI, IMAP and Notion client libraries up front
+_LAZY_IMPORTS = {
+    "BaseAgent": "agents.core",
+    "Task": "agents.core",
+    "TaskPriority": "agents.core",
+    "TaskStatus": "agents.core",
+    "AgentOrchestrator": "agents.main",
+}
+
+
+def __getattr__(name):
+    """Import main components lazily on first attribute access."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # Cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "BaseAgent",
@@ -8,13 +8,19 @@ This module provides shared functionality across all agents including:
 - Error handling patterns
 """
 
+from __future__ import annotations
+
+import functools
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
 from loguru import logger
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
 
+if TYPE_CHECKING:
+    # pydantic_ai pulls in httpx and the provider SDKs; import it only when an agent is built
+    from pydantic_ai import Agent
+
 
 class TaskPriority(str, Enum):
     """Task priority levels."""
@@ -97,31 +103,17 @@ class EmailTaskExtractor(BaseModel):
     confidence: float = Field(description="Confidence score (0-1) that this is a task", ge=0, le=1)
 
 
-def create_task_extraction_agent(model: Optional[str] = None) -> Agent[Any, EmailTaskExtractor]:
-    """
-    Create an AI agent specialized in extracting tasks from text.
-    
-    This agent is used across different integrations to identify
-    and extract task information from various sources.
-    Supports multiple AI providers:
-    - OpenAI
-    - Anthropic
-    - Google Gemini
+class BatchEmailTaskResult(EmailTaskExtractor):
+    """Extraction result for one email of a batch, tagged with the email it belongs to."""
+    email_index: int = Field(description="Number of the email this result belongs to (the N in '=== Email N ===')")
 
-    Args:
-        model: AI model to use for task extraction. If None, uses best available model.
-        
-    Returns:
-        Configured Pydantic AI agent
-    """
-    # Use the best available model if none specified
-    if model is None:
-        model = get_best_available_model()
-    
-    return Agent(
-        model=model,
-        output_type=EmailTaskExtractor,
-        system_prompt="""
+
+class BatchEmailTaskExtractor(BaseModel):
+    """Structured output for extracting tasks from several emails in one call."""
+    results: List[BatchEmailTaskResult] = Field(description="One extraction result per email, each tagged with its email number")
+
+
+TASK_EXTRACTION_PROMPT = """
         You are a task extraction specialist. Your job is to analyze text and determine if it contains a GENUINE HUMAN-TO-HUMAN TASK REQUEST.
 
         ONLY EXTRACT TASKS THAT ARE:
@@ -162,6 +154,74 @@ def create_task_extraction_agent(model: Optional[str] = None) -> Agent[Any, Emai
 
         BE EXTREMELY CONSERVATIVE - Only extract tasks you're absolutely confident are genuine human-to-human work requests.
         """
+
+
+# Cheapest model per provider, used as the first tier of the extraction cascade
+FAST_MODELS = {
+    "openai": "openai:gpt-4o-mini",
+    "anthropic": "anthropic:claude-3-5-haiku-latest",
+    "google-gla": "google-gla:gemini-2.0-flash-lite",
+    "google-vertex": "google-vertex:gemini-2.0-flash",
+}
+
+
+def create_task_extraction_agent(model: Optional[str] = None) -> Agent[Any, EmailTaskExtractor]:
+    """
+    Create an AI agent specialized in extracting tasks from text.
+    
+    This agent is used across different integrations to identify
+    and extract task information from various sources.
+    Supports multiple AI providers:
+    - OpenAI
+    - Anthropic
+    - Google Gemini
+
+    Args:
+        model: AI model to use for task extraction. If None, uses best available model.
+        
+    Returns:
+        Configured Pydantic AI agent
+    """
+    from pydantic_ai import Agent
+    
+    # Use the best available model if none specified
+    if model is None:
+        model = get_best_available_model()
+    
+    return Agent(
+        model=model,
+        output_type=EmailTaskExtractor,
+        system_prompt=TASK_EXTRACTION_PROMPT
+    )
+
+
+def create_batch_task_extraction_agent(model: Optional[str] = None) -> Agent[Any, BatchEmailTaskExtractor]:
+    """
+    Create an AI agent that extracts tasks from several emails in one call.
+    
+    Batching amortizes per-request overhead (auth, TLS, time to first token)
+    across multiple short extraction prompts.
+
+    Args:
+        model: AI model to use for task extraction. If None, uses best available model.
+        
+    Returns:
+        Configured Pydantic AI agent
+    """
+    from pydantic_ai import Agent
+    
+    if model is None:
+        model = get_best_available_model()
+    
+    return Agent(
+        model=model,
+        output_type=BatchEmailTaskExtractor,
+        system_prompt=TASK_EXTRACTION_PROMPT + """
+        BATCH MODE:
+        - The input contains several numbered emails ("=== Email 1 ===", "=== Email 2 ===", ...)
+        - Analyze each email independently using the rules above
+        - Return exactly one result per email and set its email_index to that email's number
+        """
     )
 
 
@@ -196,6 +256,26 @@ def get_available_models() -> Dict[str, List[str]]:
     }
 
 
+@functools.lru_cache(maxsize=1)
+def get_provider_key_status() -> Dict[str, bool]:
+    """
+    Check once which AI providers have a real (non-placeholder) API key.
+    
+    Settings are loaded once per process, so the result is cached.
+    
+    Returns:
+        Dictionary mapping provider names to whether a key is configured
+    """
+    from config.settings import settings
+    
+    return {
+        "openai": bool(settings.openai_api_key and settings.openai_api_key != "your-openai-api-key"),
+        "anthropic": bool(settings.anthropic_api_key and settings.anthropic_api_key != "your-anthropic-api-key"),
+        "google": bool((settings.gemini_api_key and settings.gemini_api_key != "your-gemini-api-key") or
+                       (settings.google_api_key and settings.google_api_key != "your-google-api-key")),
+    }
+
+
 def validate_model_availability(model: str) -> bool:
     """
     Validate if a model is available and properly configured.
@@ -206,58 +286,92 @@ def validate_model_availability(model: str) -> bool:
     Returns:
         True if model is available and configured
     """
-    from config.settings import settings
+    key_status = get_provider_key_status()
     
     # Check if required API keys are configured
     if model.startswith("openai:"):
-        return bool(settings.openai_api_key and settings.openai_api_key != "your-openai-api-key")
+        return key_status["openai"]
     elif model.startswith("anthropic:"):
-        return bool(settings.anthropic_api_key and settings.anthropic_api_key != "your-anthropic-api-key")
+        return key_status["anthropic"]
     elif model.startswith("google:") or model.startswith("google-gla:") or model.startswith("google-vertex:"):
-        return bool((settings.gemini_api_key and settings.gemini_api_key != "your-gemini-api-key") or
-                   (settings.google_api_key and settings.google_api_key != "your-google-api-key"))
+        return key_status["google"]
     
     return False
 
 
+@functools.lru_cache(maxsize=1)
 def get_best_available_model() -> str:
     """
     Get the best available AI model based on configured API keys.
     
+    The result only depends on settings loaded at startup, so it is
+    computed once and reused by every agent.
+    
     Returns:
         Best available model identifier
     """
     from config.settings import settings
     
+    key_status = get_provider_key_status()
+    
     # Priority order: Google Gemini 2.5 Pro > Gemini 2.5 Flash > Anthropic > OpenAI
     # Check if we have valid API keys (not placeholder values)
-    if (settings.google_api_key and settings.google_api_key != "your-google-api-key") or \
-       (settings.gemini_api_key and settings.gemini_api_key != "your-gemini-api-key"):
+    if key_status["google"]:
         return "google-gla:gemini-2.5-flash" # default
-    elif settings.anthropic_api_key and settings.anthropic_api_key != "your-anthropic-api-key":
+    elif key_status["anthropic"]:
         return "anthropic:claude-3-5-sonnet-latest"
-    elif settings.openai_api_key and settings.openai_api_key != "your-openai-api-key":
+    elif key_status["openai"]:
         return "openai:gpt-4o"
     
     # Fallback to default (may fail if no keys configured)
     return settings.default_model
 
 
-def get_task_extractor() -> Agent[Any, EmailTaskExtractor]:
+def get_fast_model(model: str) -> str:
+    """
+    Get the cheapest, fastest model from the same provider as `model`.
+    
+    Used as the first tier of the extraction cascade; `model` itself is
+    only consulted when the fast model's answer is ambiguous.
+    
+    Args:
+        model: Primary model identifier (e.g., "openai:gpt-4o")
+        
+    Returns:
+        Fast model identifier, or `model` if the provider is unknown
+    """
+    provider = model.split(":", 1)[0]
+    return FAST_MODELS.get(provider, model)
+
+
+@functools.lru_cache(maxsize=8)
+def get_task_extractor(model: Optional[str] = None) -> Agent[Any, EmailTaskExtractor]:
     """
-    Get the global task extraction agent instance.
+    Get a shared task extraction agent instance.
     
     This function ensures the agent is created with the best available model
-    when first accessed, rather than at module import time.
+    when first accessed, rather than at module import time. One agent is
+    built per model and reused, so the prompt, output schema and provider
+    client are set up only once.
+    
+    Args:
+        model: Model to extract with. If None, uses the best available model.
     
     Returns:
         Configured task extraction agent
     """
-    global task_extractor
-    if task_extractor is None:
-        task_extractor = create_task_extraction_agent()
-    return task_extractor
+    return create_task_extraction_agent(model)
 
 
-# Global task extraction agent instance - will be initialized when first used
-task_extractor = None  # Will be initialized when first used
+@functools.lru_cache(maxsize=8)
+def get_batch_task_extractor(model: Optional[str] = None) -> Agent[Any, BatchEmailTaskExtractor]:
+    """
+    Get a shared batch task extraction agent instance.
+    
+    Args:
+        model: Model to extract with. If None, uses the best available model.
+    
+    Returns:
+        Configured batch task extraction agent
+    """
+    return create_batch_task_extraction_agent(model)
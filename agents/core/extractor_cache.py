@@ -0,0 +1,314 @@
+"""
+Persistent cache for AI task-extraction results.
+
+Every email that reaches the AI model costs a network round-trip of
+several seconds plus API usage. Recurring automated senders and
+re-delivered messages often produce byte-identical text, so the
+extraction verdict is cached on disk and reused on exact matches.
+
+Key features:
+- SHA-256 keys over model identifier and canonicalized text
+- SQLite-backed storage that survives restarts
+- Least-recently-used eviction with a configurable size bound
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from fuzzywuzzy import fuzz
+from loguru import logger
+
+from agents.core import EmailTaskExtractor
+
+
+def canonicalize_text(text: str) -> str:
+    """Normalize line endings and surrounding whitespace before hashing."""
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def make_cache_key(model: str, text: str) -> bytes:
+    """Build the cache key for a model/text pair."""
+    return hashlib.sha256((model + "\0" + canonicalize_text(text)).encode("utf-8")).digest()
+
+
+class ExtractorCache:
+    """
+    Exact-match cache of `EmailTaskExtractor` outputs.
+
+    Entries are stored as JSON in a small SQLite database so cached
+    verdicts remain available across restarts. The cache is safe to
+    use from the polling loop and the real-time IDLE threads.
+    """
+
+    def __init__(self, db_path: Path = Path("data/extractor_cache.sqlite"), max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Location of the SQLite database file
+            max_entries: Maximum number of cached results before LRU eviction
+        """
+        self.logger = logger.bind(component="extractor_cache")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions ("
+            "key BLOB PRIMARY KEY, output TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON extractions(last_used)")
+        self._conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, text: str) -> Optional[EmailTaskExtractor]:
+        """
+        Look up a cached extraction result.
+
+        Args:
+            model: Model identifier used for the extraction
+            text: Full text that was sent to the model
+
+        Returns:
+            Cached EmailTaskExtractor or None on a miss
+        """
+        key = make_cache_key(model, text)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT output FROM extractions WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute(
+                    "UPDATE extractions SET last_used = ? WHERE key = ?", (time.time(), key)
+                )
+                self._conn.commit()
+                self.hits += 1
+            return EmailTaskExtractor.model_validate_json(row[0])
+        except Exception as e:
+            self.logger.warning(f"Extractor cache lookup failed: {e}")
+            return None
+
+    def set(self, model: str, text: str, output: EmailTaskExtractor) -> None:
+        """
+        Store an extraction result.
+
+        Args:
+            model: Model identifier used for the extraction
+            text: Full text that was sent to the model
+            output: Structured extraction result
+        """
+        key = make_cache_key(model, text)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO extractions (key, output, last_used) VALUES (?, ?, ?)",
+                    (key, output.model_dump_json(), time.time())
+                )
+                self._evict()
+                self._conn.commit()
+        except Exception as e:
+            self.logger.warning(f"Extractor cache store failed: {e}")
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries above the size bound (lock held)."""
+        count = self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM extractions WHERE key IN "
+                "(SELECT key FROM extractions ORDER BY last_used ASC LIMIT ?)",
+                (overflow,)
+            )
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._conn.execute("DELETE FROM extractions")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class SemanticExtractorCache:
+    """
+    Near-duplicate cache of `EmailTaskExtractor` outputs.
+
+    Templated notifications and newsletters often differ only in dates or
+    recipient names, which defeats exact-match caching. This cache embeds
+    each email with a small local sentence-transformer model and reuses
+    the verdict of the most similar previously seen email when cosine
+    similarity exceeds the threshold and the subject lines agree.
+
+    Requires the optional `sentence-transformers` package. When it is not
+    installed the cache disables itself and every lookup is a miss.
+    """
+
+    def __init__(
+        self,
+        index_path: Path = Path("data/extractor_semcache.bin"),
+        encoder_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.95,
+        max_entries: int = 5000,
+        subject_similarity: int = 80,
+        max_chars: int = 2000
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            index_path: File holding the embedding matrix (entries are stored alongside as JSON)
+            encoder_name: Sentence-transformer model used for embeddings
+            threshold: Minimum cosine similarity to reuse a cached verdict
+            max_entries: Maximum number of stored embeddings (oldest dropped first)
+            subject_similarity: Minimum subject fuzzy-match ratio to accept a neighbor
+            max_chars: Number of leading characters of the email to embed
+        """
+        self.logger = logger.bind(component="semantic_cache")
+        self.index_path = index_path
+        self.entries_path = index_path.with_suffix(".json")
+        self.encoder_name = encoder_name
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.subject_similarity = subject_similarity
+        self.max_chars = max_chars
+        self._lock = threading.Lock()
+        self._encoder = None
+        self._np = None
+        self._embeddings = None
+        self._entries = []
+        self._dirty = False
+
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer  # noqa: F401
+            self._np = np
+            self.enabled = True
+        except ImportError:
+            self.logger.warning("sentence-transformers not installed, semantic extraction cache disabled")
+            self.enabled = False
+            return
+
+        self._load()
+
+    def _load(self) -> None:
+        """Load persisted embeddings and entries if present."""
+        if not (self.index_path.exists() and self.entries_path.exists()):
+            return
+        try:
+            with open(self.index_path, "rb") as f:
+                embeddings = self._np.load(f)
+            entries = json.loads(self.entries_path.read_text(encoding="utf-8"))
+            if len(entries) == len(embeddings):
+                self._embeddings = embeddings
+                self._entries = entries
+                self.logger.info(f"Loaded {len(entries)} semantic cache entries")
+        except Exception as e:
+            self.logger.warning(f"Failed to load semantic cache: {e}")
+
+    def save(self) -> None:
+        """Persist embeddings and entries if they changed since the last save."""
+        if not self.enabled or not self._dirty:
+            return
+        try:
+            with self._lock:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.index_path, "wb") as f:
+                    self._np.save(f, self._embeddings)
+                self.entries_path.write_text(json.dumps(self._entries), encoding="utf-8")
+                self._dirty = False
+        except Exception as e:
+            self.logger.warning(f"Failed to save semantic cache: {e}")
+
+    def _embed(self, text: str):
+        """Embed text as a unit-length float32 vector."""
+        if self._encoder is None:
+            from sentence_transformers import SentenceTransformer
+            self._encoder = SentenceTransformer(self.encoder_name, device="cpu")
+        vector = self._encoder.encode(
+            canonicalize_text(text)[:self.max_chars],
+            normalize_embeddings=True
+        )
+        return self._np.asarray(vector, dtype=self._np.float32)
+
+    def lookup(self, model: str, subject: str, text: str) -> Optional[EmailTaskExtractor]:
+        """
+        Find a cached verdict for a near-duplicate email.
+
+        Args:
+            model: Model identifier used for the extraction
+            subject: Email subject, used to reject lexically drifted neighbors
+            text: Full text that would be sent to the model
+
+        Returns:
+            Cached EmailTaskExtractor or None on a miss
+        """
+        if not self.enabled or self._embeddings is None:
+            return None
+        try:
+            vector = self._embed(text)
+            with self._lock:
+                scores = self._embeddings @ vector
+                # Check the few nearest neighbors in order of similarity
+                for idx in self._np.argsort(scores)[::-1][:5]:
+                    if scores[idx] < self.threshold:
+                        break
+                    entry = self._entries[idx]
+                    if entry["model"] != model:
+                        continue
+                    if fuzz.ratio(entry["subject"].lower(), subject.lower()) < self.subject_similarity:
+                        continue
+                    self.logger.debug(f"Semantic cache hit (similarity={scores[idx]:.3f})")
+                    return EmailTaskExtractor.model_validate_json(entry["output"])
+        except Exception as e:
+            self.logger.warning(f"Semantic cache lookup failed: {e}")
+        return None
+
+    def add(self, model: str, subject: str, text: str, output: EmailTaskExtractor) -> None:
+        """
+        Store an extraction result with its embedding.
+
+        Args:
+            model: Model identifier used for the extraction
+            subject: Email subject
+            text: Full text that was sent to the model
+            output: Structured extraction result
+        """
+        if not self.enabled:
+            return
+        try:
+            vector = self._embed(text)[None, :]
+            entry = {"model": model, "subject": subject, "output": output.model_dump_json()}
+            with self._lock:
+                if self._embeddings is None:
+                    self._embeddings = vector
+                else:
+                    self._embeddings = self._np.vstack([self._embeddings, vector])
+                self._entries.append(entry)
+
+                overflow = len(self._entries) - self.max_entries
+                if overflow > 0:
+                    self._embeddings = self._embeddings[overflow:]
+                    self._entries = self._entries[overflow:]
+                self._dirty = True
+        except Exception as e:
+            self.logger.warning(f"Semantic cache store failed: {e}")
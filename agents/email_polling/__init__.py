@@ -12,23 +12,150 @@ Key features:
 - Configurable polling intervals
 """
 
+from __future__ import annotations
+
 import imaplib
 import email
 import email.header
 import email.utils
 import email.message
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
-from pathlib import Path
-import pickle
+from dataclasses import dataclass, field
 import asyncio
-import time
+import functools
+import threading
+import re
+
+from dateutil import parser as dateutil_parser
 
 # Internal imports (will work after pip install)
-from agents.core import BaseAgent, Task, TaskPriority, get_task_extractor
+from agents.core import (
+    BaseAgent, EmailTaskExtractor, Task, TaskPriority,
+    get_batch_task_extractor, get_fast_model, get_task_extractor
+)
+from agents.core.extractor_cache import ExtractorCache, SemanticExtractorCache
+from agents.email_polling.processed_store import ProcessedEmailStore
 from config.settings import settings
 
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+
+
+# Headers retained on EmailMessage for cheap automated-mail detection
+BULK_MAIL_HEADERS = ('List-Unsubscribe', 'List-Id', 'Precedence', 'Auto-Submitted', 'X-Auto-Response-Suppress')
+
+# Only the start of each message is downloaded and kept; the AI model never needs more
+MAX_FETCH_BYTES = 65536
+MAX_CONTENT_CHARS = 8192
+FETCH_ITEMS = f'(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.{MAX_FETCH_BYTES}>)'
+
+# Messages per FETCH command; larger message sets give no further speedup
+FETCH_BATCH_SIZE = 100
+
+# Locates the UID in a UID FETCH response line (servers may order data items freely)
+FETCH_UID_RE = re.compile(rb'UID (\d+)')
+
+# First-phase FETCH: just the headers needed to drop seen and automated emails
+HEADER_FETCH_ITEMS = (
+    '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE MESSAGE-ID '
+    f'{" ".join(name.upper() for name in BULK_MAIL_HEADERS)})])'
+)
+
+# Quoted reply history carries no new request; drop it before extraction
+REPLY_HEADER_RE = re.compile(r'^On\b[^\n]{0,200}(\n[^\n]{0,200})?\bwrote:\s*$', re.MULTILINE)
+QUOTED_LINE_RE = re.compile(r'^>.*(\n|$)', re.MULTILINE)
+
+# Sender fragments excluded in the IMAP SEARCH itself, before anything is fetched
+SERVER_EXCLUDED_SENDERS = ('noreply', 'no-reply', 'donotreply', 'do-not-reply', 'notifications', 'newsletter', 'mailer-daemon')
+
+# Shared natural-language date parser for extracted due dates
+DUE_DATE_PARSER = dateutil_parser.parser()
+
+# Compiled once at import: cheap pre-filters applied before any AI call
+AUTOMATED_SENDER_RE = re.compile(
+    r'(noreply|no-reply|donotreply|do-not-reply|notifications?|security|alerts?|'
+    r'billing|support|marketing|newsletter|mailer-daemon)@',
+    re.IGNORECASE
+)
+NEWSLETTER_PHRASE_RE = re.compile(
+    r'unsubscribe|view (this email )?in (your|a) browser|manage (your )?(email )?preferences|'
+    r'you are receiving this (email|message) because',
+    re.IGNORECASE
+)
+
+
+def _compile_indicators(indicators: Tuple[str, ...]) -> re.Pattern:
+    """Compile literal indicator substrings into one case-insensitive alternation."""
+    return re.compile('|'.join(map(re.escape, indicators)), re.IGNORECASE)
+
+
+# Keyword lists for `EmailAgent._is_automated_email`, each scanned in a single regex pass
+AUTOMATED_SENDER_INDICATORS_RE = _compile_indicators((
+    'noreply@', 'no-reply@', 'donotreply@', 'do-not-reply@',
+    'security@', 'alerts@', 'notifications@', 'system@',
+    'admin@', 'support@', 'help@', 'info@', 'news@',
+    'updates@', 'marketing@', 'promo@', 'newsletter@',
+    'accounts@', 'billing@', 'payments@', 'services@'
+))
+AUTOMATED_SUBJECT_INDICATORS_RE = _compile_indicators((
+    'security alert', 'security warning', 'account alert',
+    'password reset', 'login attempt', 'suspicious activity',
+    'verify your account', 'confirmation required', 'activate your',
+    'welcome to', 'thank you for', 'subscription', 'newsletter',
+    'unsubscribe', 'promotion', 'offer', 'deal', 'sale',
+    'invoice', 'receipt', 'payment', 'billing', 'statement',
+    'notification', 'reminder', 'alert', 'update available',
+    'system maintenance', 'service update', 'terms of service'
+))
+AUTOMATED_CONTENT_INDICATORS_RE = _compile_indicators((
+    'this is an automated message', 'do not reply to this email',
+    'this email was sent automatically', 'unsubscribe',
+    'click here to verify', 'activate your account',
+    'for security reasons', 'suspicious activity detected',
+    'please verify your identity', 'account security'
+))
+
+
+def parse_due_date(value: str) -> Optional[datetime]:
+    """
+    Parse a due date extracted by the AI model.
+    
+    ISO dates (the format the model is asked for) take the C-level
+    `fromisoformat` fast path; anything else goes through dateutil.
+    
+    Args:
+        value: Due date text such as "2025-03-05" or "March 5th"
+        
+    Returns:
+        Parsed datetime, or None if the text is not a recognizable date
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return DUE_DATE_PARSER.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def decode_header_value(header: str) -> str:
+    """
+    Decode an RFC 2047 encoded header value.
+    
+    Senders and subjects repeat heavily across an inbox, so results are
+    memoized to skip repeated charset conversions.
+    """
+    decoded_parts = []
+    for part, encoding in email.header.decode_header(header):
+        if isinstance(part, bytes):
+            part = part.decode(encoding or 'utf-8', errors='ignore')
+        decoded_parts.append(part)
+    
+    return ''.join(decoded_parts)
+
 
 @dataclass
 class EmailMessage:
@@ -39,6 +166,8 @@ class EmailMessage:
     date: datetime
     message_id: str
     is_unread: bool = True
+    headers: Dict[str, str] = field(default_factory=dict)
+    uid: Optional[bytes] = None  # IMAP UID the message was fetched with
 
 
 class EmailAgent(BaseAgent):
@@ -58,39 +187,61 @@ class EmailAgent(BaseAgent):
         self.imap_port = settings.email_imap_port
         self.check_interval = settings.email_check_interval
         
+        # Persistent IMAP connection, opened lazily and reused across polls
+        self._mail: Optional[imaplib.IMAP4_SSL] = None
+        self._mail_lock = threading.Lock()
+        self._uid_validity: Optional[str] = None
+        
         # Track processed emails to avoid duplicates
-        self.processed_emails_file = Path("data/processed_emails.pkl")
-        self.processed_emails = self._load_processed_emails()
+        self.processed_emails = ProcessedEmailStore()
+        
+        # Two-tier extraction: fast model first, selected model only for ambiguous results
+        self.fast_model = get_fast_model(self.model) if settings.enable_model_cascade else self.model
+        self.cascade_stats = {"fast": 0, "escalated": 0}
+        
+        # Cache AI extraction results so identical emails skip the model call
+        self.extraction_cache = None
+        if settings.enable_extraction_cache:
+            self.extraction_cache = ExtractorCache(max_entries=settings.extraction_cache_size)
+        
+        # Optional near-duplicate cache for templated/automated emails
+        self.semantic_cache = None
+        if settings.enable_semantic_cache:
+            self.semantic_cache = SemanticExtractorCache(threshold=settings.semantic_cache_threshold)
         
         self.logger.info(f"Email agent configured for {self.email_address}")
     
-    def _load_processed_emails(self) -> set:
-        """Load the set of already processed email IDs."""
-        if self.processed_emails_file.exists():
-            try:
-                with open(self.processed_emails_file, 'rb') as f:
-                    return pickle.load(f)
-            except Exception as e:
-                self.log_error(e, "Loading processed emails")
-                return set()
-        return set()
+    @functools.cached_property
+    def task_extractor(self) -> Agent:
+        """Extraction agent for the first (fast) tier, built on first use."""
+        return get_task_extractor(self.fast_model)
     
-    def _save_processed_emails(self) -> None:
-        """Save the set of processed email IDs."""
-        self.processed_emails_file.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            with open(self.processed_emails_file, 'wb') as f:
-                pickle.dump(self.processed_emails, f)
-            self.logger.info(f"Saved {len(self.processed_emails)} processed email IDs")
-        except Exception as e:
-            self.log_error(e, "Saving processed emails")
+    @functools.cached_property
+    def escalation_extractor(self) -> Agent:
+        """Extraction agent for the selected model, used for ambiguous results."""
+        return get_task_extractor(self.model)
+    
+    @functools.cached_property
+    def batch_extractor(self) -> Agent:
+        """Batch extraction agent for the first (fast) tier, built on first use."""
+        return get_batch_task_extractor(self.fast_model)
     
     def clear_processed_emails(self) -> None:
         """Clear all processed email IDs (for testing/debugging)."""
         self.processed_emails.clear()
-        self._save_processed_emails()
         self.logger.info("Cleared all processed email IDs")
     
+    def prune_processed_emails(self) -> int:
+        """
+        Drop processed email IDs older than the configured retention period.
+        
+        Returns:
+            Number of removed IDs
+        """
+        removed = self.processed_emails.prune(settings.processed_email_retention_days * 86400)
+        self.logger.info(f"Pruned {removed} processed email IDs older than {settings.processed_email_retention_days} days")
+        return removed
+    
     def get_processed_email_count(self) -> int:
         """Get the number of processed emails."""
         return len(self.processed_emails)
@@ -116,6 +267,50 @@ class EmailAgent(BaseAgent):
             self.log_error(e, "Connecting to email server")
             raise
     
+    def _get_connection(self) -> imaplib.IMAP4_SSL:
+        """
+        Return the persistent IMAP connection, reconnecting only if it has dropped.
+        
+        Callers must hold `_mail_lock`.
+        
+        Returns:
+            Live IMAP4_SSL connection with the inbox selected
+        """
+        if self._mail is not None:
+            try:
+                status, _ = self._mail.noop()
+                if status == 'OK':
+                    return self._mail
+            except (imaplib.IMAP4.abort, imaplib.IMAP4.error, OSError) as e:
+                self.logger.info(f"IMAP connection lost, reconnecting: {e}")
+            self._drop_connection()
+        
+        self._mail = self.connect_to_email()
+        
+        # UIDs are only comparable while the mailbox UIDVALIDITY is unchanged
+        _, data = self._mail.response('UIDVALIDITY')
+        self._uid_validity = data[0].decode() if data and data[0] else None
+        return self._mail
+    
+    def _drop_connection(self) -> None:
+        """Discard the persistent IMAP connection (callers must hold `_mail_lock`)."""
+        if self._mail is None:
+            return
+        try:
+            self._mail.logout()
+        except Exception:
+            pass
+        self._mail = None
+    
+    def close(self) -> None:
+        """Close the persistent IMAP connection and the SQLite-backed stores."""
+        with self._mail_lock:
+            self._drop_connection()
+        self.processed_emails.close()
+        if self.extraction_cache:
+            self.extraction_cache.close()
+        self.logger.info("Closed email server connection")
+    
     def fetch_new_emails(self, since_days: int = 7, limit: int = 50) -> List[EmailMessage]:
         """
         Fetch new emails from the inbox that haven't been processed yet.
@@ -127,61 +322,304 @@ class EmailAgent(BaseAgent):
         Returns:
             List of EmailMessage objects
         """
-        try:
-            mail = self.connect_to_email()
-            
-            # Search for all emails from the last N days (not just unread)
-            since_date = (datetime.now() - timedelta(days=since_days)).strftime('%d-%b-%Y')
-            search_criteria = f'(SINCE {since_date})'
-            
-            self.logger.info(f"Searching for emails since {since_date} (limit: {limit})")
-            
-            status, messages = mail.search(None, search_criteria)
-            if status != 'OK':
-                self.logger.warning(f"Email search failed: {status}")
-                mail.close()
+        with self._mail_lock:
+            try:
+                mail = self._get_connection()
+                
+                # Search for all emails from the last N days (not just unread),
+                # skipping UIDs already settled in earlier polls
+                since_date = (datetime.now() - timedelta(days=since_days)).strftime('%d-%b-%Y')
+                last_uid = self._load_uid_mark(since_days)
+                search_criteria = self._build_search_criteria(since_date, last_uid)
+                
+                self.logger.info(f"Searching for emails since {since_date} after UID {last_uid} (limit: {limit})")
+                
+                status, messages = mail.uid('SEARCH', None, search_criteria)
+                if status != 'OK':
+                    self.logger.warning(f"Email search failed: {status}")
+                    return []
+                
+                # "UID n:*" always matches the newest message, even when its UID is below n
+                searched_ids = sorted((uid for uid in messages[0].split() if int(uid) > last_uid), key=int)
+                
+                # Sort email IDs to process newest first (reverse order)
+                email_ids = searched_ids[::-1]
+                
+                # Apply limit to email IDs
+                if len(email_ids) > limit:
+                    self.logger.info(f"Found {len(email_ids)} emails, processing latest {limit}")
+                    email_ids = email_ids[:limit]
+                else:
+                    self.logger.info(f"Found {len(email_ids)} emails, processing all")
+                
+                limited_out = searched_ids[:len(searched_ids) - len(email_ids)]
+                
+                processed_count = 0
+                if settings.enable_header_prefetch:
+                    email_ids, processed_count = self._filter_by_headers(mail, email_ids)
+                
+                emails = []
+                settled_ids = set()
+                for email_msg in self._fetch_messages(mail, email_ids):
+                    if email_msg.message_id not in self.processed_emails:
+                        emails.append(email_msg)
+                        self.logger.info(f"New email found: {email_msg.subject[:50]}...")
+                    else:
+                        settled_ids.add(email_msg.uid)
+                        processed_count += 1
+                
+                # Everything not settled by the header pass or found processed in the
+                # full fetch must be searched again next poll
+                pending_ids = [email_id for email_id in email_ids if email_id not in settled_ids]
+                self._advance_uid_mark(since_days, last_uid, searched_ids, limited_out + pending_ids)
+                
+                self.logger.info(f"Found {len(emails)} new emails ({processed_count} already processed)")
+                return emails
+                
+            except Exception as e:
+                # Reconnect on the next poll rather than reusing a broken session
+                self._drop_connection()
+                self.log_error(e, "Fetching new emails")
                 return []
+    
+    def _load_uid_mark(self, since_days: int) -> int:
+        """
+        Return the UID high-water mark for a search window.
+        
+        Every UID up to the mark that falls within the window has been
+        settled. Marks are kept per window size, since a narrow window
+        (e.g. real-time polls) doesn't see older unsettled emails that a
+        wider one still has to retry. The mark is stored together with the
+        mailbox UIDVALIDITY and ignored if the server has since renumbered
+        the mailbox.
+        
+        Args:
+            since_days: Search window of the poll, in days
             
-            email_ids = messages[0].split()
-            
-            # Sort email IDs to process newest first (reverse order)
-            email_ids = email_ids[::-1]
+        Returns:
+            Highest settled UID, or 0 if unknown
+        """
+        stored = self.processed_emails.get_state(f'inbox_uid_mark:{since_days}')
+        if not stored or self._uid_validity is None:
+            return 0
+        validity, _, uid = stored.partition(':')
+        if validity != self._uid_validity or not uid.isdigit():
+            return 0
+        return int(uid)
+    
+    def _advance_uid_mark(self, since_days: int, last_uid: int, searched_ids: List[bytes], pending_ids: List[bytes]) -> None:
+        """
+        Move the UID high-water mark past the emails settled in this poll.
+        
+        Emails still awaiting extraction (or cut off by the fetch limit)
+        keep the mark below them, so they are searched again until they
+        end up in the processed store.
+        
+        Args:
+            since_days: Search window of the poll, in days
+            last_uid: Current high-water mark
+            searched_ids: UIDs returned by this poll's search
+            pending_ids: UIDs that are not yet settled
+        """
+        if not searched_ids or self._uid_validity is None:
+            return
+        if pending_ids:
+            new_mark = min(int(uid) for uid in pending_ids) - 1
+        else:
+            new_mark = max(int(uid) for uid in searched_ids)
+        if new_mark > last_uid:
+            self.processed_emails.set_state(f'inbox_uid_mark:{since_days}', f"{self._uid_validity}:{new_mark}")
+    
+    def _build_search_criteria(self, since_date: str, last_uid: int = 0) -> str:
+        """
+        Build the IMAP SEARCH criteria for a polling cycle.
+        
+        When server-side filtering is enabled, mailing-list and obvious
+        automated senders are excluded by the server so they are never
+        fetched. Gmail additionally gets an X-GM-RAW query, which is
+        answered from its own search index.
+        
+        Args:
+            since_date: Earliest date to include, in IMAP date format
+            last_uid: UID high-water mark; only later UIDs are searched
             
-            # Apply limit to email IDs
-            if len(email_ids) > limit:
-                self.logger.info(f"Found {len(email_ids)} emails, processing latest {limit}")
-                email_ids = email_ids[:limit]
-            else:
-                self.logger.info(f"Found {len(email_ids)} emails, processing all")
+        Returns:
+            Parenthesized IMAP search criteria
+        """
+        criteria = [f'SINCE {since_date}']
+        if last_uid:
+            criteria.append(f'UID {last_uid + 1}:*')
+        
+        if settings.enable_server_side_filter:
+            criteria.append('NOT HEADER "List-Unsubscribe" ""')
+            criteria.append('NOT HEADER "Precedence" "bulk"')
+            criteria.extend(f'NOT FROM "{sender}"' for sender in SERVER_EXCLUDED_SENDERS)
+            if 'gmail' in self.imap_server.lower():
+                gmail_query = ' '.join(f'-from:{sender}' for sender in SERVER_EXCLUDED_SENDERS)
+                criteria.append(f'X-GM-RAW "{gmail_query}"')
+        
+        return f'({" ".join(criteria)})'
+    
+    def _filter_by_headers(self, mail: imaplib.IMAP4_SSL, email_ids: List[bytes]) -> Tuple[List[bytes], int]:
+        """
+        Drop already-processed and automated emails using only their headers.
+        
+        A handful of header fields is a few hundred bytes per message, so
+        bodies are only downloaded for emails that can still yield a task.
+        Automated emails are marked as processed here, exactly as they
+        would be after a full fetch.
+        
+        Args:
+            mail: IMAP connection
+            email_ids: Candidate email IDs
             
-            emails = []
-            processed_count = 0
+        Returns:
+            Tuple of (surviving email IDs in the original order, number already processed)
+        """
+        survivors = []
+        automated_ids = []
+        processed_count = 0
+        
+        for start in range(0, len(email_ids), FETCH_BATCH_SIZE):
+            batch = email_ids[start:start + FETCH_BATCH_SIZE]
+            try:
+                sections = self._fetch_sections(mail, batch, HEADER_FETCH_ITEMS)
+            except imaplib.IMAP4.error as e:
+                if isinstance(e, imaplib.IMAP4.abort):
+                    raise
+                self.logger.warning(f"Header fetch failed, fetching {len(batch)} emails in full: {e}")
+                survivors.extend(batch)
+                continue
+            for email_id in batch:
+                if email_id not in sections:
+                    # Let the full fetch decide what to do with it
+                    survivors.append(email_id)
+                    continue
+                email_msg = self._parse_email_bytes(email_id, sections[email_id][0])
+                if email_msg is None:
+                    survivors.append(email_id)
+                elif email_msg.message_id in self.processed_emails:
+                    processed_count += 1
+                elif self._is_likely_automated(email_msg) or self._is_automated_email(email_msg):
+                    automated_ids.append(email_msg.message_id)
+                    self.logger.debug("Skipping automated email from headers: {}", email_msg.subject)
+                else:
+                    survivors.append(email_id)
+        
+        self.processed_emails.update(automated_ids)
+        self.logger.info(
+            f"Header pre-filter kept {len(survivors)}/{len(email_ids)} emails "
+            f"({processed_count} already processed, {len(automated_ids)} automated)"
+        )
+        return survivors, processed_count
+    
+    def _fetch_messages(self, mail: imaplib.IMAP4_SSL, email_ids: List[bytes]) -> List[EmailMessage]:
+        """
+        Fetch and parse several emails, FETCH_BATCH_SIZE messages per IMAP command.
+        
+        If the server rejects a batched FETCH, the messages of that batch
+        are fetched one at a time instead.
+        
+        Args:
+            mail: IMAP connection
+            email_ids: Email IDs to fetch
             
-            for email_id in email_ids:
-                try:
+        Returns:
+            Parsed EmailMessage objects in the order of email_ids
+        """
+        messages = []
+        for start in range(0, len(email_ids), FETCH_BATCH_SIZE):
+            batch = email_ids[start:start + FETCH_BATCH_SIZE]
+            try:
+                messages.extend(self._fetch_message_batch(mail, batch))
+            except imaplib.IMAP4.error as e:
+                if isinstance(e, imaplib.IMAP4.abort) or len(batch) == 1:
+                    raise
+                self.logger.warning(f"Batched fetch failed, fetching {len(batch)} emails individually: {e}")
+                for email_id in batch:
                     email_msg = self._parse_email(mail, email_id)
                     if email_msg:
-                        if email_msg.message_id not in self.processed_emails:
-                            emails.append(email_msg)
-                            self.logger.info(f"New email found: {email_msg.subject[:50]}...")
-                        else:
-                            processed_count += 1
-                except Exception as e:
-                    self.log_error(e, f"Parsing email {email_id}")
-                    continue
-            
-            mail.close()
+                        messages.append(email_msg)
+        return messages
+    
+    def _fetch_message_batch(self, mail: imaplib.IMAP4_SSL, email_ids: List[bytes]) -> List[EmailMessage]:
+        """
+        Fetch and parse several emails with a single IMAP FETCH command.
+        
+        One FETCH over the whole message set costs a single round trip
+        instead of one per email. Only the headers and the first
+        MAX_FETCH_BYTES of each body are downloaded, using BODY.PEEK so
+        messages are not flagged as read.
+        
+        Args:
+            mail: IMAP connection
+            email_ids: Email IDs to fetch
             
-            self.logger.info(f"Found {len(emails)} new emails ({processed_count} already processed)")
-            return emails
-                
-        except Exception as e:
-            self.log_error(e, "Fetching new emails")
+        Returns:
+            Parsed EmailMessage objects in the order of email_ids
+        """
+        if not email_ids:
             return []
+        
+        sections = self._fetch_sections(mail, email_ids, FETCH_ITEMS)
+        bodies = {email_id: header + text for email_id, (header, text) in sections.items()}
+        
+        messages = []
+        for email_id in email_ids:
+            email_msg = self._parse_email_bytes(email_id, bodies.get(email_id))
+            if email_msg:
+                messages.append(email_msg)
+        return messages
+    
+    def _fetch_sections(self, mail: imaplib.IMAP4_SSL, email_ids: List[bytes], items: str) -> Dict[bytes, Tuple[bytes, bytes]]:
+        """
+        Run one FETCH command and split the response per message.
+        
+        Args:
+            mail: IMAP connection
+            email_ids: Email IDs to fetch
+            items: FETCH data items to request
+            
+        Returns:
+            Mapping of email UID to (header bytes, text bytes); text is empty
+            when `items` requests headers only
+        """
+        status, msg_data = mail.uid('FETCH', b','.join(email_ids).decode(), items)
+        if status != 'OK' or not msg_data:
+            self.logger.warning(f"Email fetch failed: {status}")
+            return {}
+        
+        # Each message yields (b'<seq> (UID <uid> BODY[HEADER] {n}', header) followed by
+        # (b' BODY[TEXT]<0> {m}', text) and a closing b')'; the UID item may also
+        # arrive in one of the later parts
+        sections = {}
+        uids = {}
+        current_seq = None
+        for item in msg_data:
+            prefix, data = item if isinstance(item, tuple) and len(item) == 2 else (item, None)
+            if not isinstance(prefix, bytes):
+                continue
+            if prefix[:1].isdigit():
+                current_seq = prefix.split(b' ', 1)[0]
+            if current_seq is None:
+                continue
+            uid_match = FETCH_UID_RE.search(prefix)
+            if uid_match:
+                uids[current_seq] = uid_match.group(1)
+            if data is None:
+                continue
+            header, text = sections.get(current_seq, (b'', b''))
+            if b'HEADER' in prefix:
+                header = data
+            else:
+                text = data
+            sections[current_seq] = (header, text)
+        
+        return {uids[seq]: parts for seq, parts in sections.items() if seq in uids}
     
     def _parse_email(self, mail: imaplib.IMAP4_SSL, email_id: bytes) -> Optional[EmailMessage]:
         """
-        Parse an individual email message.
+        Fetch and parse an individual email message.
         
         Args:
             mail: IMAP connection
@@ -191,17 +629,29 @@ class EmailAgent(BaseAgent):
             EmailMessage object or None if parsing fails
         """
         try:
-            status, msg_data = mail.fetch(email_id.decode(), '(RFC822)')
-            if status != 'OK' or not msg_data or not msg_data[0]:
-                return None
+            messages = self._fetch_message_batch(mail, [email_id])
+            return messages[0] if messages else None
+            
+        except Exception as e:
+            self.log_error(e, f"Parsing email {email_id}")
+            return None
+    
+    def _parse_email_bytes(self, email_id: bytes, email_body: Optional[bytes]) -> Optional[EmailMessage]:
+        """
+        Parse a raw RFC822 email body.
+        
+        Args:
+            email_id: Email ID the body was fetched for (used in error logs)
+            email_body: Raw message bytes
             
-            # msg_data[0] is a tuple: (message_part, data)
-            email_body = msg_data[0][1]
+        Returns:
+            EmailMessage object or None if parsing fails
+        """
+        try:
             if not email_body or not isinstance(email_body, bytes):
                 return None
                 
-            import email as email_module
-            email_message = email_module.message_from_bytes(email_body)
+            email_message = email.message_from_bytes(email_body)
             
             # Extract basic information
             subject = self._decode_header(email_message.get('Subject', ''))
@@ -211,21 +661,29 @@ class EmailAgent(BaseAgent):
             
             # Parse date
             try:
-                import email.utils
                 date = email.utils.parsedate_to_datetime(date_str)
-            except:
+            except (TypeError, ValueError):
                 date = datetime.now()
             
             # Extract content
             content = self._extract_email_content(email_message)
             
+            # Keep the headers used by the automated-mail heuristic
+            headers = {
+                name: str(email_message[name])
+                for name in BULK_MAIL_HEADERS
+                if email_message[name] is not None
+            }
+            
             return EmailMessage(
                 subject=subject,
                 sender=sender,
                 content=content,
                 date=date,
                 message_id=message_id,
-                is_unread=True
+                is_unread=True,
+                headers=headers,
+                uid=email_id
             )
             
         except Exception as e:
@@ -236,31 +694,69 @@ class EmailAgent(BaseAgent):
         """Decode email header handling various encodings."""
         if not header:
             return ''
+        if isinstance(header, str):
+            return decode_header_value(header)
+        # email.header.Header objects are unhashable, decode them uncached
+        return decode_header_value.__wrapped__(header)
+    
+    def _decode_payload(self, part: email.message.Message) -> str:
+        """Decode a MIME part payload using its declared charset."""
+        payload = part.get_payload(decode=True)
+        if not payload or not isinstance(payload, bytes):
+            return ''
+        charset = part.get_content_charset() or 'utf-8'
+        try:
+            return payload.decode(charset, errors='ignore')
+        except LookupError:
+            return payload.decode('utf-8', errors='ignore')
+    
+    def _extract_email_content(self, email_message: email.message.Message) -> str:
+        """Extract text content from email message, capped at MAX_CONTENT_CHARS."""
+        if not email_message.is_multipart():
+            return self._decode_payload(email_message)[:MAX_CONTENT_CHARS].strip()
         
-        decoded_parts = []
-        for part, encoding in email.header.decode_header(header):
-            if isinstance(part, bytes):
-                part = part.decode(encoding or 'utf-8', errors='ignore')
-            decoded_parts.append(part)
+        # Collect parts and join once instead of repeated string concatenation
+        parts = []
+        length = 0
+        for part in email_message.walk():
+            if part.get_content_type() != "text/plain" or part.get_content_disposition() == "attachment":
+                continue
+            text = self._decode_payload(part)
+            parts.append(text)
+            length += len(text)
+            if length >= MAX_CONTENT_CHARS:
+                break
         
-        return ''.join(decoded_parts)
+        return ''.join(parts)[:MAX_CONTENT_CHARS].strip()
     
-    def _extract_email_content(self, email_message: email.message.Message) -> str:
-        """Extract text content from email message."""
-        content = ""
-        
-        if email_message.is_multipart():
-            for part in email_message.walk():
-                if part.get_content_type() == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    if payload and isinstance(payload, bytes):
-                        content += payload.decode('utf-8', errors='ignore')
-        else:
-            payload = email_message.get_payload(decode=True)
-            if payload and isinstance(payload, bytes):
-                content = payload.decode('utf-8', errors='ignore')
+    def _is_likely_automated(self, email_msg: EmailMessage) -> bool:
+        """
+        Cheap header and regex heuristic for bulk or machine-sent email.
         
-        return content.strip()
+        Mailing-list and auto-submitted headers are set by bulk senders and
+        almost never by a person writing a task request, so they are
+        checked before the broader keyword scan in `_is_automated_email`.
+        
+        Args:
+            email_msg: Email message to check
+            
+        Returns:
+            True if email is almost certainly automated, False otherwise
+        """
+        headers = email_msg.headers
+        if 'List-Unsubscribe' in headers or 'List-Id' in headers:
+            return True
+        if headers.get('Precedence', '').strip().lower() in ('bulk', 'list', 'junk'):
+            return True
+        if headers.get('Auto-Submitted', 'no').strip().lower() != 'no':
+            return True
+        if 'X-Auto-Response-Suppress' in headers:
+            return True
+        
+        if AUTOMATED_SENDER_RE.search(email_msg.sender):
+            return True
+        
+        return bool(NEWSLETTER_PHRASE_RE.search(email_msg.content))
     
     def _is_automated_email(self, email_msg: EmailMessage) -> bool:
         """
@@ -272,50 +768,141 @@ class EmailAgent(BaseAgent):
         Returns:
             True if email appears to be automated, False otherwise
         """
-        # Check sender for automated indicators
-        sender_lower = email_msg.sender.lower()
-        automated_senders = [
-            'noreply@', 'no-reply@', 'donotreply@', 'do-not-reply@',
-            'security@', 'alerts@', 'notifications@', 'system@',
-            'admin@', 'support@', 'help@', 'info@', 'news@',
-            'updates@', 'marketing@', 'promo@', 'newsletter@',
-            'accounts@', 'billing@', 'payments@', 'services@'
-        ]
-        
-        if any(indicator in sender_lower for indicator in automated_senders):
-            return True
-        
-        # Check subject for automated indicators
-        subject_lower = email_msg.subject.lower()
-        automated_subjects = [
-            'security alert', 'security warning', 'account alert',
-            'password reset', 'login attempt', 'suspicious activity',
-            'verify your account', 'confirmation required', 'activate your',
-            'welcome to', 'thank you for', 'subscription', 'newsletter',
-            'unsubscribe', 'promotion', 'offer', 'deal', 'sale',
-            'invoice', 'receipt', 'payment', 'billing', 'statement',
-            'notification', 'reminder', 'alert', 'update available',
-            'system maintenance', 'service update', 'terms of service'
-        ]
-        
-        if any(indicator in subject_lower for indicator in automated_subjects):
+        return bool(
+            AUTOMATED_SENDER_INDICATORS_RE.search(email_msg.sender)
+            or AUTOMATED_SUBJECT_INDICATORS_RE.search(email_msg.subject)
+            or AUTOMATED_CONTENT_INDICATORS_RE.search(email_msg.content)
+        )
+    
+    def _trim_content_for_extraction(self, content: str) -> str:
+        """Strip quoted reply history and cap content at the extraction budget."""
+        match = REPLY_HEADER_RE.search(content)
+        if match:
+            content = content[:match.start()]
+        content = QUOTED_LINE_RE.sub('', content)
+        return content[:settings.max_extraction_chars].strip()
+    
+    def _build_extraction_text(self, email_msg: EmailMessage) -> str:
+        """Combine subject, sender and trimmed content into the text sent to the AI model."""
+        content = self._trim_content_for_extraction(email_msg.content)
+        return f"Subject: {email_msg.subject}\n\nSender: {email_msg.sender}\n\nContent:\n{content}"
+    
+    def _should_skip_extraction(self, email_msg: EmailMessage) -> bool:
+        """Check whether an email can be rejected without calling the AI model."""
+        # First check: Skip if email is already processed
+        if email_msg.message_id in self.processed_emails:
+            self.logger.debug("Email already processed, skipping: {}", email_msg.message_id)
             return True
         
-        # Check content for automated indicators
-        content_lower = email_msg.content.lower()
-        automated_content = [
-            'this is an automated message', 'do not reply to this email',
-            'this email was sent automatically', 'unsubscribe',
-            'click here to verify', 'activate your account',
-            'for security reasons', 'suspicious activity detected',
-            'please verify your identity', 'account security'
-        ]
-        
-        if any(indicator in content_lower for indicator in automated_content):
-            return True
+        # Pre-filter: Skip automated/system emails
+        if self._is_likely_automated(email_msg) or self._is_automated_email(email_msg):
+            self.logger.info(f"Skipping automated email: {email_msg.subject}")
+            return True  # Don't mark as processed yet - let process_new_emails handle it
         
         return False
     
+    def _get_cached_extraction(self, email_msg: EmailMessage, full_text: str) -> Optional[EmailTaskExtractor]:
+        """Look up a previously stored extraction result for this email."""
+        extracted = None
+        if self.extraction_cache:
+            extracted = self.extraction_cache.get(self.model, full_text)
+        if extracted is None and self.semantic_cache:
+            extracted = self.semantic_cache.lookup(self.model, email_msg.subject, full_text)
+        
+        if extracted is not None:
+            self.logger.debug("Reusing cached extraction for email: {}", email_msg.message_id)
+        return extracted
+    
+    def _store_extraction(self, email_msg: EmailMessage, full_text: str, extracted: EmailTaskExtractor) -> None:
+        """Store a fresh extraction result in the enabled caches."""
+        if self.extraction_cache:
+            self.extraction_cache.set(self.model, full_text, extracted)
+        if self.semantic_cache:
+            self.semantic_cache.add(self.model, email_msg.subject, full_text, extracted)
+    
+    def _build_task(self, email_msg: EmailMessage, extracted: EmailTaskExtractor) -> Optional[Task]:
+        """
+        Turn an extraction result into a Task if it is a confident task request.
+        
+        Args:
+            email_msg: Source email message
+            extracted: Structured extraction result for the email
+            
+        Returns:
+            Task object if the result qualifies, None otherwise
+        """
+        self.logger.info(f"Task extraction result: confidence={extracted.confidence}, is_task={extracted.is_task}")
+        
+        # Only create task if confidence is high enough - be very conservative
+        if extracted.is_task and extracted.confidence >= 0.8:  # Raised threshold for human tasks
+            # Parse due date if provided
+            due_date = None
+            if extracted.due_date:
+                due_date = parse_due_date(extracted.due_date)
+                if due_date is None:
+                    # Stored as text in metadata for manual review
+                    self.logger.warning(f"Could not parse due date: {extracted.due_date}")
+            
+            metadata = {
+                "sender": email_msg.sender,
+                "subject": email_msg.subject,
+                "confidence": extracted.confidence,
+                "email_date": email_msg.date.isoformat(),
+                "message_id": email_msg.message_id  # Store for tracking
+            }
+            
+            # Add raw due date if parsing failed
+            if extracted.due_date and due_date is None:
+                metadata["raw_due_date"] = extracted.due_date
+            
+            task = Task(
+                title=extracted.title,
+                description=extracted.description,
+                priority=extracted.priority,
+                source="email",
+                source_id=email_msg.message_id,  # Use message_id for duplicate detection
+                due_date=due_date,
+                tags=extracted.tags,
+                metadata=metadata
+            )
+            
+            # Don't mark as processed here - let the main pipeline do it after successful Notion creation
+            self.log_task_processed(task)
+            return task
+        
+        self.logger.info(f"Email not identified as task: confidence={extracted.confidence}, is_task={extracted.is_task}")
+        self.logger.info(f"Subject: {email_msg.subject}")
+        self.logger.info(f"Content preview: {email_msg.content[:200]}...")
+        
+        # Return None but don't mark as processed yet - let process_new_emails handle it
+        return None
+    
+    async def _escalate_if_ambiguous(self, full_text: str, extracted: EmailTaskExtractor) -> EmailTaskExtractor:
+        """
+        Re-run extraction with the selected model when the fast model is unsure.
+        
+        Args:
+            full_text: Text that was sent to the fast model
+            extracted: Fast model's extraction result
+            
+        Returns:
+            The selected model's result for ambiguous confidence, otherwise `extracted`
+        """
+        if self.fast_model == self.model:
+            return extracted
+        
+        if not 0.5 <= extracted.confidence <= 0.8:
+            self.cascade_stats["fast"] += 1
+            return extracted
+        
+        self.cascade_stats["escalated"] += 1
+        self.logger.info(
+            f"Escalating ambiguous extraction (confidence={extracted.confidence}) to {self.model} "
+            f"[fast={self.cascade_stats['fast']}, escalated={self.cascade_stats['escalated']}]"
+        )
+        result = await self.escalation_extractor.run(full_text)
+        return result.output
+    
     async def extract_tasks_from_email(self, email_msg: EmailMessage) -> Optional[Task]:
         """
         Extract task information from an email using AI with enhanced duplicate prevention.
@@ -327,83 +914,142 @@ class EmailAgent(BaseAgent):
             Task object if a task is found, None otherwise
         """
         try:
-            # First check: Skip if email is already processed
-            if email_msg.message_id in self.processed_emails:
-                self.logger.debug(f"Email already processed, skipping: {email_msg.message_id}")
+            if self._should_skip_extraction(email_msg):
                 return None
             
-            # Pre-filter: Skip automated/system emails
-            if self._is_automated_email(email_msg):
-                self.logger.info(f"Skipping automated email: {email_msg.subject}")
-                return None  # Don't mark as processed yet - let process_new_emails handle it
-            
-            # Combine subject and content for analysis
-            full_text = f"Subject: {email_msg.subject}\n\nSender: {email_msg.sender}\n\nContent:\n{email_msg.content}"
-            
-            # Use AI to extract task information
-            result = await get_task_extractor().run(full_text)
-            extracted = result.output
-            
-            self.logger.info(f"Task extraction result: confidence={extracted.confidence}, is_task={extracted.is_task}")
-            
-            # Only create task if confidence is high enough - be very conservative
-            if extracted.is_task and extracted.confidence >= 0.8:  # Raised threshold for human tasks
-                # Parse due date if provided
-                due_date = None
-                if extracted.due_date:
-                    try:
-                        # Try standard format first
-                        due_date = datetime.strptime(extracted.due_date, '%Y-%m-%d')
-                    except ValueError:
-                        # Try to parse natural language dates
-                        try:
-                            import dateutil.parser
-                            due_date = dateutil.parser.parse(extracted.due_date)
-                        except Exception:
-                            self.logger.warning(f"Could not parse due date: {extracted.due_date}")
-                            # Store as text in metadata for manual review
-                            due_date = None
-                
-                metadata = {
-                    "sender": email_msg.sender,
-                    "subject": email_msg.subject,
-                    "confidence": extracted.confidence,
-                    "email_date": email_msg.date.isoformat(),
-                    "message_id": email_msg.message_id  # Store for tracking
-                }
-                
-                # Add raw due date if parsing failed
-                if extracted.due_date and due_date is None:
-                    metadata["raw_due_date"] = extracted.due_date
-                
-                task = Task(
-                    title=extracted.title,
-                    description=extracted.description,
-                    priority=extracted.priority,
-                    source="email",
-                    source_id=email_msg.message_id,  # Use message_id for duplicate detection
-                    due_date=due_date,
-                    tags=extracted.tags,
-                    metadata=metadata
-                )
-                
-                # Don't mark as processed here - let the main pipeline do it after successful Notion creation
-                self.log_task_processed(task)
-                return task
-            else:
-                self.logger.info(f"Email not identified as task: confidence={extracted.confidence}, is_task={extracted.is_task}")
-                self.logger.info(f"Subject: {email_msg.subject}")
-                self.logger.info(f"Content preview: {email_msg.content[:200]}...")
-                
-                # Return None but don't mark as processed yet - let process_new_emails handle it
+            full_text = self._build_extraction_text(email_msg)
+            
+            # Use AI to extract task information (reuse cached verdicts when available)
+            extracted = self._get_cached_extraction(email_msg, full_text)
+            if extracted is not None:
+                return self._build_task(email_msg, extracted)
             
+        except Exception as e:
+            self.log_error(e, f"Extracting tasks from email {email_msg.message_id}")
+            # Don't mark as processed if there was an error - allow retry
             return None
+        
+        return await self._extract_with_model(email_msg, full_text)
+    
+    async def _extract_with_model(self, email_msg: EmailMessage, full_text: str) -> Optional[Task]:
+        """
+        Run the extraction model on prepared text, then cache the result and build the task.
+        
+        Callers have already applied the skip filters and missed the cache.
+        
+        Args:
+            email_msg: Email message being analyzed
+            full_text: Text built by `_build_extraction_text`
+            
+        Returns:
+            Task object if a task is found, None otherwise
+        """
+        try:
+            result = await self.task_extractor.run(full_text)
+            extracted = await self._escalate_if_ambiguous(full_text, result.output)
+            self._store_extraction(email_msg, full_text, extracted)
+            return self._build_task(email_msg, extracted)
             
         except Exception as e:
             self.log_error(e, f"Extracting tasks from email {email_msg.message_id}")
             # Don't mark as processed if there was an error - allow retry
             return None
     
+    async def extract_tasks_batch(self, email_msgs: List[EmailMessage]) -> List[Optional[Task]]:
+        """
+        Extract tasks from several emails with a single AI call.
+        
+        Emails that are filtered out or answered from the cache never reach
+        the model; the rest are numbered and sent together. Results are
+        matched back by the email number the model reports; emails whose
+        number is missing or duplicated (or all of them, if the batch call
+        fails) are retried individually.
+        
+        Args:
+            email_msgs: Email messages to analyze
+            
+        Returns:
+            List aligned with email_msgs holding a Task or None per email
+        """
+        results: List[Optional[Task]] = [None] * len(email_msgs)
+        pending = []
+        
+        for i, email_msg in enumerate(email_msgs):
+            try:
+                if self._should_skip_extraction(email_msg):
+                    continue
+                full_text = self._build_extraction_text(email_msg)
+                extracted = self._get_cached_extraction(email_msg, full_text)
+                if extracted is not None:
+                    results[i] = self._build_task(email_msg, extracted)
+                else:
+                    pending.append((i, email_msg, full_text))
+            except Exception as e:
+                self.log_error(e, f"Extracting tasks from email {email_msg.message_id}")
+        
+        if not pending:
+            return results
+        
+        if len(pending) == 1:
+            i, email_msg, full_text = pending[0]
+            results[i] = await self._extract_with_model(email_msg, full_text)
+            return results
+        
+        prompt = "\n\n".join(
+            f"=== Email {n} ===\n{full_text}" for n, (_, _, full_text) in enumerate(pending, 1)
+        )
+        
+        # Map results back by the email number the model reports, never by position
+        matched: Dict[int, EmailTaskExtractor] = {}
+        try:
+            result = await self.batch_extractor.run(prompt)
+            seen: Dict[int, int] = {}
+            for output in result.output.results:
+                seen[output.email_index] = seen.get(output.email_index, 0) + 1
+            for output in result.output.results:
+                n = output.email_index
+                if 1 <= n <= len(pending) and seen[n] == 1:
+                    matched[n - 1] = EmailTaskExtractor(**output.model_dump(exclude={"email_index"}))
+            if len(matched) != len(pending):
+                self.logger.warning(
+                    f"Batch extraction matched {len(matched)}/{len(pending)} emails "
+                    "(missing or duplicate indices), retrying the rest individually"
+                )
+        except Exception as e:
+            self.log_error(e, f"Batch extraction of {len(pending)} emails, retrying individually")
+        
+        if matched:
+            self.logger.info(f"Extracted {len(matched)} emails in one batch call")
+        
+        unmatched = [entry for n, entry in enumerate(pending) if n not in matched]
+        batched = [(entry, matched[n]) for n, entry in enumerate(pending) if n in matched]
+        
+        # Retry unmatched emails and escalate ambiguous batch results concurrently
+        retried, escalated = await asyncio.gather(
+            asyncio.gather(
+                *(self._extract_with_model(email_msg, full_text) for _, email_msg, full_text in unmatched)
+            ),
+            asyncio.gather(
+                *(self._escalate_if_ambiguous(full_text, extracted)
+                  for (_, _, full_text), extracted in batched),
+                return_exceptions=True
+            )
+        )
+        
+        for (i, _, _), task in zip(unmatched, retried):
+            results[i] = task
+        
+        for ((i, email_msg, full_text), _), extracted in zip(batched, escalated):
+            try:
+                if isinstance(extracted, Exception):
+                    raise extracted
+                self._store_extraction(email_msg, full_text, extracted)
+                results[i] = self._build_task(email_msg, extracted)
+            except Exception as e:
+                self.log_error(e, f"Extracting tasks from email {email_msg.message_id}")
+        
+        return results
+    
     async def process_new_emails(self, since_days: int = 7, limit: int = 50) -> List[Task]:
         """
         Process new emails and extract tasks.
@@ -415,39 +1061,87 @@ class EmailAgent(BaseAgent):
         Returns:
             List of extracted tasks
         """
+        tasks = []
+        async for batch_tasks in self.iter_new_tasks(since_days=since_days, limit=limit):
+            tasks.extend(batch_tasks)
+        return tasks
+    
+    async def iter_new_tasks(self, since_days: int = 7, limit: int = 50) -> AsyncIterator[List[Task]]:
+        """
+        Process new emails, yielding extracted tasks as each extraction batch finishes.
+        
+        Extraction batches keep running while the caller handles a yielded
+        batch, so downstream work (e.g. Notion creation) overlaps with the
+        remaining AI calls.
+        
+        Args:
+            since_days: Number of days back to check for emails
+            limit: Maximum number of emails to process in one batch
+            
+        Yields:
+            Tasks extracted from one batch of emails, in completion order
+        """
         self.logger.info("Starting email processing")
         
-        # Fetch new emails with limit
-        new_emails = self.fetch_new_emails(since_days=since_days, limit=limit)
+        # Fetch new emails with limit (blocking IMAP I/O runs off the event loop)
+        new_emails = await asyncio.to_thread(self.fetch_new_emails, since_days=since_days, limit=limit)
         if not new_emails:
             self.logger.info("No new emails to process")
-            return []
+            return
         
-        # Process each email
-        tasks = []
-        for email_msg in new_emails:
-            try:
-                task = await self.extract_tasks_from_email(email_msg)
-                if task:
-                    tasks.append(task)
-                    # DON'T mark as processed yet - let the main pipeline handle this
-                    # after successful Notion creation
-                else:
-                    # If no task was extracted, mark as processed to avoid reprocessing
-                    # non-task emails, but log it for debugging
-                    self.processed_emails.add(email_msg.message_id)
-                    self.logger.debug(f"Email marked as processed (no task found): {email_msg.subject}")
+        # Process emails in batches to amortize AI call overhead, running
+        # several batches concurrently within the provider's rate limits
+        batch_size = max(1, settings.extraction_batch_size)
+        batches = [new_emails[start:start + batch_size] for start in range(0, len(new_emails), batch_size)]
+        semaphore = asyncio.Semaphore(max(1, settings.extraction_concurrency))
+        
+        async def extract_batch(batch: List[EmailMessage]):
+            async with semaphore:
+                try:
+                    return batch, await self.extract_tasks_batch(batch)
+                except Exception as e:
+                    return batch, e
+        
+        pending = [asyncio.ensure_future(extract_batch(batch)) for batch in batches]
+        task_count = 0
+        no_task_ids = []
+        try:
+            for next_done in asyncio.as_completed(pending):
+                batch, batch_tasks = await next_done
+                if isinstance(batch_tasks, Exception):
+                    self.log_error(batch_tasks, f"Processing batch of {len(batch)} emails")
+                    # Don't mark as processed if there was an error - retry later
+                    continue
                 
-            except Exception as e:
-                self.log_error(e, f"Processing email {email_msg.message_id}")
-                # Don't mark as processed if there was an error - retry later
-                continue
+                tasks = []
+                for email_msg, task in zip(batch, batch_tasks):
+                    if task:
+                        tasks.append(task)
+                        # DON'T mark as processed yet - let the main pipeline handle this
+                        # after successful Notion creation
+                    else:
+                        # If no task was extracted, mark as processed to avoid reprocessing
+                        # non-task emails, but log it for debugging
+                        no_task_ids.append(email_msg.message_id)
+                        self.logger.debug("Email marked as processed (no task found): {}", email_msg.subject)
+                
+                if tasks:
+                    task_count += len(tasks)
+                    yield tasks
+        finally:
+            # Stop outstanding extractions if the caller gave up early
+            for future in pending:
+                future.cancel()
+            
+            # Persist the no-task IDs seen so far even if the caller stopped early or
+            # the generator was closed by an exception; one small transaction, written
+            # inline because awaiting is unreliable while the generator is being closed
+            self.processed_emails.update(no_task_ids)
         
-        # Save processed emails
-        self._save_processed_emails()
+        if self.semantic_cache:
+            await asyncio.to_thread(self.semantic_cache.save)
         
-        self.logger.info(f"Processed {len(new_emails)} emails, extracted {len(tasks)} tasks")
-        return tasks
+        self.logger.info(f"Processed {len(new_emails)} emails, extracted {task_count} tasks")
     
     def mark_task_as_processed(self, task: Task) -> None:
         """
@@ -460,8 +1154,7 @@ class EmailAgent(BaseAgent):
         """
         if task.source_id:
             self.processed_emails.add(task.source_id)
-            self._save_processed_emails()
-            self.logger.debug(f"Marked email as processed: {task.source_id}")
+            self.logger.debug("Marked email as processed: {}", task.source_id)
     
     def mark_tasks_as_processed(self, tasks: List[Task]) -> None:
         """
@@ -470,20 +1163,21 @@ class EmailAgent(BaseAgent):
         Args:
             tasks: List of tasks whose source emails should be marked as processed
         """
-        for task in tasks:
-            if task.source_id:
-                self.processed_emails.add(task.source_id)
-        
-        self._save_processed_emails()
+        self.processed_emails.update(task.source_id for task in tasks if task.source_id)
         self.logger.debug(f"Marked {len(tasks)} emails as processed")
     
-    def start_polling(self) -> None:
-        """Start the email polling loop."""
+    async def start_polling(self) -> None:
+        """
+        Run the email polling loop on the current event loop.
+        
+        The loop (and the AI provider HTTP clients bound to it) lives for the
+        whole polling session; start it once with `asyncio.run(agent.start_polling())`.
+        """
         self.logger.info(f"Starting email polling every {self.check_interval} seconds")
         
         while True:
             try:
-                tasks = asyncio.run(self.process_new_emails())
+                tasks = await self.process_new_emails()
                 if tasks:
                     self.logger.info(f"Found {len(tasks)} new tasks")
                     # Tasks will be processed by the main orchestrator
@@ -492,4 +1186,4 @@ class EmailAgent(BaseAgent):
                 self.log_error(e, "Email polling loop")
             
             # Wait before next check
-            time.sleep(self.check_interval)
+            await asyncio.sleep(self.check_interval)
@@ -0,0 +1,241 @@
+"""
+Persistent store of processed email IDs.
+
+The email agent must remember every message it has already handled so
+it never extracts the same task twice. This module keeps those IDs in
+an append-only SQLite table instead of rewriting a pickled set after
+every polling cycle.
+
+Key features:
+- Set-like interface (`in`, `add`, `update`, `len`, `clear`)
+- Time-based pruning of entries older than the polling window
+- O(1) inserts and indexed membership checks
+- WAL journaling for cheap per-insert commits
+- In-memory Bloom filter that answers "never seen" without touching disk
+- One-time import of the legacy pickle file
+- Small key/value table for polling state such as the IMAP UID high-water mark
+"""
+
+import hashlib
+import math
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+from loguru import logger
+
+# False-positive rate of the in-memory filter; a false positive costs one indexed SQLite lookup
+BLOOM_ERROR_RATE = 1e-4
+
+
+class BloomFilter:
+    """
+    Minimal in-memory Bloom filter over strings.
+
+    A negative answer is definite; a positive answer must be confirmed
+    against the backing store.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Size the filter.
+
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate at capacity
+        """
+        self.capacity = max(1, capacity)
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class ProcessedEmailStore:
+    """
+    SQLite-backed set of processed email message IDs.
+
+    Safe to share between the polling loop and the real-time IDLE
+    callback threads.
+    """
+
+    def __init__(self, db_path: Path = Path("data/processed_emails.sqlite"),
+                 legacy_pickle: Path = Path("data/processed_emails.pkl")):
+        """
+        Open (or create) the store.
+
+        Args:
+            db_path: Location of the SQLite database file
+            legacy_pickle: Old pickle file to import on first use, if present
+        """
+        self.logger = logger.bind(component="processed_store")
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_table()
+
+        self._rebuild_bloom()
+        self._import_legacy_pickle(legacy_pickle)
+
+    def _create_table(self) -> None:
+        """
+        Create the ID table as a WITHOUT ROWID table.
+
+        A rowid table stores every message ID twice (row and primary-key
+        index); keying the b-tree on the ID itself halves the file size.
+        Tables created by earlier versions are converted in place.
+        """
+        schema = "CREATE TABLE {name} (msg_id TEXT PRIMARY KEY, processed_at INTEGER NOT NULL) WITHOUT ROWID"
+        row = self._conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'processed'"
+        ).fetchone()
+        if row is None:
+            self._conn.execute(schema.format(name="processed"))
+        elif "WITHOUT ROWID" not in row[0].upper():
+            self._conn.execute(schema.format(name="processed_compact"))
+            self._conn.execute("INSERT INTO processed_compact SELECT msg_id, processed_at FROM processed")
+            self._conn.execute("DROP TABLE processed")
+            self._conn.execute("ALTER TABLE processed_compact RENAME TO processed")
+            self.logger.info("Converted processed email table to WITHOUT ROWID storage")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.commit()
+
+    def _rebuild_bloom(self, min_capacity: int = 100000) -> None:
+        """Rebuild the Bloom filter from the table, sized for future growth."""
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+            self._count = count
+            bloom = BloomFilter(capacity=max(min_capacity, count * 2), error_rate=BLOOM_ERROR_RATE)
+            # Stream IDs from the cursor rather than materializing them all in memory
+            for (msg_id,) in self._conn.execute("SELECT msg_id FROM processed"):
+                bloom.add(msg_id)
+            # Swap in only when complete; __contains__ reads the filter without the lock
+            self._bloom = bloom
+
+    def _import_legacy_pickle(self, legacy_pickle: Path) -> None:
+        """Import IDs from the previous pickle-based store once, then retire the file."""
+        if not legacy_pickle.exists():
+            return
+        try:
+            with open(legacy_pickle, 'rb') as f:
+                legacy_ids = pickle.load(f)
+            self.update(legacy_ids)
+            legacy_pickle.rename(legacy_pickle.with_suffix(".pkl.migrated"))
+            self.logger.info(f"Imported {len(legacy_ids)} processed email IDs from {legacy_pickle}")
+        except Exception as e:
+            self.logger.error(f"Failed to import legacy processed emails: {e}")
+
+    def __contains__(self, msg_id: object) -> bool:
+        if not isinstance(msg_id, str) or msg_id not in self._bloom:
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE msg_id = ? LIMIT 1", (msg_id,)
+            ).fetchone()
+        return row is not None
+
+    def add(self, msg_id: str) -> None:
+        """Record a message ID as processed."""
+        with self._lock:
+            self._count += self._conn.execute(
+                "INSERT OR IGNORE INTO processed (msg_id, processed_at) VALUES (?, ?)",
+                (msg_id, int(time.time()))
+            ).rowcount
+            self._conn.commit()
+            self._bloom.add(msg_id)
+        self._grow_bloom_if_full()
+
+    def update(self, msg_ids: Iterable[str]) -> None:
+        """Record several message IDs as processed in one transaction."""
+        msg_ids = list(msg_ids)
+        if not msg_ids:
+            return
+        now = int(time.time())
+        with self._lock:
+            self._count += self._conn.executemany(
+                "INSERT OR IGNORE INTO processed (msg_id, processed_at) VALUES (?, ?)",
+                ((msg_id, now) for msg_id in msg_ids)
+            ).rowcount
+            self._conn.commit()
+            for msg_id in msg_ids:
+                self._bloom.add(msg_id)
+        self._grow_bloom_if_full()
+
+    def _grow_bloom_if_full(self) -> None:
+        """Resize the Bloom filter once it exceeds its capacity."""
+        if self._bloom.count > self._bloom.capacity:
+            self._rebuild_bloom()
+
+    def prune(self, max_age_seconds: int) -> int:
+        """
+        Forget message IDs processed longer ago than `max_age_seconds`.
+
+        Emails older than the polling search window are never fetched
+        again, so their IDs only cost disk space and Bloom filter bits.
+
+        Args:
+            max_age_seconds: Age beyond which entries are removed
+
+        Returns:
+            Number of removed entries
+        """
+        cutoff = int(time.time()) - max_age_seconds
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM processed WHERE processed_at < ?", (cutoff,)).rowcount
+            self._conn.commit()
+        if removed:
+            self._rebuild_bloom()
+        return removed
+
+    def get_state(self, key: str) -> Optional[str]:
+        """Read a small piece of polling state (e.g. the IMAP UID high-water mark)."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_state(self, key: str, value: str) -> None:
+        """Persist a small piece of polling state."""
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Forget all processed message IDs and polling state."""
+        with self._lock:
+            self._conn.execute("DELETE FROM processed")
+            self._conn.execute("DELETE FROM state")
+            self._count = 0
+            self._conn.commit()
+            self._bloom = BloomFilter(capacity=self._bloom.capacity, error_rate=BLOOM_ERROR_RATE)
+
+    def __len__(self) -> int:
+        # Maintained on every write; COUNT(*) would scan the whole table
+        return self._count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
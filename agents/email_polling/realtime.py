@@ -42,6 +42,13 @@ class RealTimeEmailProcessor:
         self.last_idle_restart = datetime.now()
         self.idle_restart_interval = 1800  # Restart IDLE every 30 minutes
         
+        # Server capabilities don't change between sessions; probe IDLE support once
+        self._idle_supported: Optional[bool] = None
+        
+        # Persistent event loop (in its own thread) that runs email callbacks
+        self._callback_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._callback_loop_lock = threading.Lock()
+        
         # Connection settings
         self.imap_server = settings.email_imap_server
         self.imap_port = settings.email_imap_port
@@ -85,6 +92,7 @@ class RealTimeEmailProcessor:
             # Connect to IMAP server
             client = IMAPClient(self.imap_server, port=self.imap_port, use_uid=True, ssl=True)
             client.login(self.email_address, self.email_password)
+            self._idle_supported = b'IDLE' in client.capabilities()
             client.select_folder('INBOX')
             
             session_start = datetime.now()
@@ -111,14 +119,18 @@ class RealTimeEmailProcessor:
                         # Restart IDLE
                         client.idle()
                         
-                    # Restart IDLE session periodically (server timeout prevention)
+                    # Re-issue IDLE periodically (server timeout prevention), keeping
+                    # the logged-in connection instead of reconnecting
                     if datetime.now() - session_start > timedelta(seconds=self.idle_restart_interval):
-                        self.logger.info("Restarting IDLE session")
+                        self.logger.info("Restarting IDLE command")
                         client.idle_done()
-                        break
+                        client.idle()
+                        session_start = datetime.now()
                         
                 except IMAPClientError as e:
                     self.logger.error(f"IDLE check error: {e}")
+                    # Re-check capabilities on the next login or status request
+                    self._idle_supported = None
                     break
                     
             # Clean up IDLE
@@ -142,28 +154,47 @@ class RealTimeEmailProcessor:
         try:
             self.logger.info("Triggering real-time email processing")
             
-            # Run the callback in a separate thread to avoid blocking IDLE
-            processing_thread = threading.Thread(
-                target=self._run_email_callback,
-                daemon=True
-            )
-            processing_thread.start()
+            # Hand the callback to the callback loop thread to avoid blocking IDLE
+            self._run_email_callback()
             
         except Exception as e:
             self.logger.error(f"Error triggering email processing: {e}")
     
+    def _get_callback_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the callback event loop, starting its thread on first use."""
+        with self._callback_loop_lock:
+            if self._callback_loop is None:
+                self._callback_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._callback_loop.run_forever,
+                    name="realtime-callbacks",
+                    daemon=True
+                ).start()
+            return self._callback_loop
+    
     def _run_email_callback(self) -> None:
-        """Run the email callback in a separate thread."""
+        """Schedule the email callback on the persistent callback loop."""
+        loop = self._get_callback_loop()
+        
+        # Use the loop directly if the callback is async
+        if asyncio.iscoroutinefunction(self.email_callback):
+            future = asyncio.run_coroutine_threadsafe(self.email_callback(), loop)
+            future.add_done_callback(self._log_callback_error)
+        else:
+            loop.call_soon_threadsafe(self._call_sync_callback)
+    
+    def _call_sync_callback(self) -> None:
+        """Run a synchronous email callback on the callback loop."""
         try:
-            # Use asyncio to run the callback if it's async
-            if asyncio.iscoroutinefunction(self.email_callback):
-                asyncio.run(self.email_callback())
-            else:
-                self.email_callback()
-                
+            self.email_callback()
         except Exception as e:
             self.logger.error(f"Email callback error: {e}")
     
+    def _log_callback_error(self, future) -> None:
+        """Log an exception raised by an async email callback."""
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"Email callback error: {future.exception()}")
+    
     def process_webhook_notification(self, webhook_data: Dict[str, Any]) -> None:
         """
         Process webhook notification from email service.
@@ -187,9 +218,15 @@ class RealTimeEmailProcessor:
         """
         Check if the email server supports IMAP IDLE.
         
+        The result is cached after the first successful check (or IDLE
+        session login), so status requests don't open a new IMAP session.
+        
         Returns:
             bool: True if IDLE is supported
         """
+        if self._idle_supported is not None:
+            return self._idle_supported
+        
         try:
             client = IMAPClient(self.imap_server, port=self.imap_port, use_uid=True, ssl=True)
             client.login(self.email_address, self.email_password)
@@ -200,6 +237,7 @@ class RealTimeEmailProcessor:
             
             client.logout()
             
+            self._idle_supported = idle_supported
             self.logger.info(f"IMAP IDLE supported: {idle_supported}")
             return idle_supported
             
@@ -10,11 +10,14 @@ for the application. It handles:
 """
 
 import asyncio
-import schedule
+import itertools
+import random
+import threading
 import time
-from typing import List, Optional
-from datetime import datetime
+from typing import Deque, List, Optional, Set, Tuple
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from loguru import logger
 
 # Internal imports
@@ -25,6 +28,22 @@ from agents.notion_integration import NotionAgent
 from config.settings import settings
 
 
+# (epoch second, ISO prefix) of the last log timestamp, reused within the same second
+_timestamp_prefix = (0, "")
+
+
+def log_timestamp() -> str:
+    """Current local time as an ISO 8601 string with millisecond precision."""
+    global _timestamp_prefix
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_prefix
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_prefix = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1000):03d}"
+
+
 class AgentOrchestrator:
     """
     Main orchestrator that coordinates all agents.
@@ -49,8 +68,27 @@ class AgentOrchestrator:
         
         # Initialize agents with the selected model
         try:
-            self.email_agent = EmailAgent(model=self.model)
-            self.notion_agent = NotionAgent(model=self.model)
+            # Email agent setup is local (SQLite store, caches) while Notion setup is
+            # network round trips; overlap them so startup costs the slower one only
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="agent-init") as init_pool:
+                email_agent_future = init_pool.submit(EmailAgent, model=self.model)
+                notion_agent = None
+                try:
+                    notion_agent = NotionAgent(model=self.model)
+                    
+                    # Validate Notion database setup
+                    if not notion_agent.validate_database_setup():
+                        raise ValueError("Notion database is not properly configured")
+                    
+                    self.email_agent = email_agent_future.result()
+                except Exception:
+                    # Don't leak the agents' IMAP connection, SQLite handles and HTTP pool
+                    if notion_agent is not None:
+                        notion_agent.close()
+                    if email_agent_future.exception() is None:
+                        email_agent_future.result().close()
+                    raise
+                self.notion_agent = notion_agent
             
             # Initialize real-time email processor
             self.realtime_processor = RealTimeEmailProcessor(
@@ -59,29 +97,46 @@ class AgentOrchestrator:
             
             # Auto-start real-time monitoring if enabled
             if getattr(settings, 'enable_realtime_email', True):
-                # Start in a separate thread to avoid blocking initialization
-                import threading
-                threading.Thread(
-                    target=self._start_realtime_delayed,
-                    daemon=True
-                ).start()
+                # Start after a short delay to avoid blocking initialization
+                realtime_timer = threading.Timer(2.0, self._start_realtime_delayed)
+                realtime_timer.daemon = True
+                realtime_timer.start()
             
-            # Validate Notion database setup
-            if not self.notion_agent.validate_database_setup():
-                raise ValueError("Notion database is not properly configured")
-                
             self.logger.info("All agents initialized successfully")
             
         except Exception as e:
             self.logger.error(f"Failed to initialize agents: {e}")
             raise
         
+        # Email processing configuration (see configure_email_processing)
+        self.email_limit = 50
+        self.since_days = 7
+        self.check_interval_minutes = settings.email_check_interval // 60
+        
         # Task processing queue
-        self.task_queue: List[Task] = []
-        self.processing_lock = None  # Initialize lazily to avoid event loop issues
+        self.max_queued_tasks = 1024
+        self.task_queue: Deque[Task] = deque(maxlen=self.max_queued_tasks)  # Bounded; oldest entries drop off
+        
+        # Source emails whose tasks a running pipeline is creating; lets pipelines on
+        # different loops (background cycles, real-time callbacks) run side by side
+        # without creating the same Notion page twice
+        self._inflight_source_ids: Set[str] = set()
+        self._inflight_lock = threading.Lock()
+        
+        # Pipeline runs holding the current agents; agents replaced by switch_model
+        # are closed once the last run that started with them has finished
+        self._agent_users = 0
+        self._retired_agents: List[Tuple[EmailAgent, NotionAgent]] = []
+        self._agents_lock = threading.Lock()
+        
+        # (monotonic time, status) of the last real-time status read, reused for a short while
+        self.realtime_status_ttl = 0.5  # seconds
+        self._realtime_status_cache = (0.0, None)
         
-        # Background task executor
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        # IDLE notifications arriving within this window share one pipeline run
+        self.realtime_debounce_window = 0.5  # seconds
+        self._realtime_pending = False
+        self._realtime_draining = False
         
         # System stats
         self.stats = {
@@ -91,13 +146,26 @@ class AgentOrchestrator:
             "last_run": None,
             "uptime_start": datetime.now()
         }
+        # ISO strings are computed when the timestamps change, not on every stats broadcast
+        self._uptime_start_iso = self.stats["uptime_start"].isoformat()
+        self._last_run_iso: Optional[str] = None
+        self._uptime_start_monotonic = time.monotonic()  # Uptime math, immune to wall-clock jumps
         
         # Real-time log buffer for dashboard
-        self.log_buffer = []
         self.max_log_entries = 50
+        self.log_buffer = deque(maxlen=self.max_log_entries)  # Oldest entries drop off automatically
         
         # WebSocket integration for real-time updates
         self.websocket_manager = None  # Will be set by API server
+        self.websocket_loop: Optional[asyncio.AbstractEventLoop] = None  # Loop owning the WebSocket connections
+        
+        # Broadcasts are coalesced into short windows instead of one send per event
+        self.broadcast_window = 0.05  # seconds
+        self._pending_logs: List[dict] = []
+        self._log_flush_scheduled = False
+        self._stats_flush_scheduled = False
+        self._broadcast_lock = threading.Lock()
+        self._broadcast_tasks: Set[asyncio.Task] = set()  # Strong refs so in-flight sends aren't GC'd
         
         # Add initial system startup log
         self.add_log_entry("INFO", "System", "AI Agents Swarm initialized")
@@ -105,18 +173,43 @@ class AgentOrchestrator:
     def set_websocket_manager(self, websocket_manager):
         """Set the WebSocket manager for real-time updates."""
         self.websocket_manager = websocket_manager
+        try:
+            # Called from the API server's startup hook, i.e. on the loop serving the WebSockets
+            self.websocket_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.websocket_loop = None
+    
+    def _schedule_broadcast(self, coro) -> None:
+        """
+        Run a WebSocket broadcast coroutine on the API server's event loop.
+        
+        Safe to call from any thread: from the server loop the coroutine is
+        scheduled as a task, from other threads and loops (background cycles,
+        real-time callbacks) it is handed over with run_coroutine_threadsafe.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if running_loop is not None and self.websocket_loop in (None, running_loop):
+            self._start_broadcast_task(running_loop, coro)
+        elif self.websocket_loop is not None and self.websocket_loop.is_running():
+            asyncio.run_coroutine_threadsafe(coro, self.websocket_loop)
+        else:
+            coro.close()  # No loop to deliver on; drop the update
     
     def add_log_entry(self, level: str, component: str, message: str):
         """Add a log entry to the real-time buffer."""
         try:
             # Initialize log_buffer if it doesn't exist
-            if not hasattr(self, 'log_buffer'):
-                self.log_buffer = []
             if not hasattr(self, 'max_log_entries'):
                 self.max_log_entries = 50
+            if not hasattr(self, 'log_buffer'):
+                self.log_buffer = deque(maxlen=self.max_log_entries)
             
             entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": log_timestamp(),
                 "level": level,
                 "component": component,
                 "message": message
@@ -124,27 +217,10 @@ class AgentOrchestrator:
             
             self.log_buffer.append(entry)
             
-            # Keep only the latest entries
-            if len(self.log_buffer) > self.max_log_entries:
-                self.log_buffer = self.log_buffer[-self.max_log_entries:]
-            
             # Broadcast to WebSocket clients if available
             if self.websocket_manager and hasattr(self.websocket_manager, 'send_log_update'):
                 try:
-                    # Check if we're in an async context
-                    try:
-                        loop = asyncio.get_running_loop()
-                        asyncio.create_task(self.websocket_manager.send_log_update(entry))
-                    except RuntimeError:
-                        # Not in async context, create a new event loop in a thread
-                        import threading
-                        def run_in_thread():
-                            try:
-                                asyncio.run(self.websocket_manager.send_log_update(entry))
-                            except Exception:
-                                pass
-                        thread = threading.Thread(target=run_in_thread, daemon=True)
-                        thread.start()
+                    self._queue_log_broadcast(entry)
                 except Exception:
                     pass  # Don't let WebSocket issues break logging
                     
@@ -156,29 +232,85 @@ class AgentOrchestrator:
         """Get recent log entries for the dashboard."""
         if not hasattr(self, 'log_buffer'):
             return []
-        return self.log_buffer[-limit:] if self.log_buffer else []
+        return list(itertools.islice(self.log_buffer, max(0, len(self.log_buffer) - limit), None))
     
-    def _get_processing_lock(self):
-        """Get the processing lock, creating it if necessary."""
-        if self.processing_lock is None:
-            self.processing_lock = asyncio.Lock()
-        return self.processing_lock
+    def _claim_tasks(self, tasks: List[Task]) -> List[Task]:
+        """
+        Reserve tasks for the calling pipeline run.
+        
+        Tasks whose source email another running pipeline has already
+        claimed are dropped; that run creates them and marks the email
+        processed (or leaves it for a retry if creation fails).
+        
+        Args:
+            tasks: Newly extracted tasks
+            
+        Returns:
+            The tasks this run should create
+        """
+        with self._inflight_lock:
+            claimed = [task for task in tasks if task.source_id not in self._inflight_source_ids]
+            self._inflight_source_ids.update(task.source_id for task in claimed if task.source_id)
+        return claimed
+    
+    def _release_tasks(self, tasks: List[Task]) -> None:
+        """Release tasks claimed with `_claim_tasks` once the run has finished with them."""
+        with self._inflight_lock:
+            self._inflight_source_ids.difference_update(task.source_id for task in tasks if task.source_id)
+    
+    def _acquire_agents(self) -> Tuple[EmailAgent, NotionAgent]:
+        """
+        Pin the current agents for a pipeline run.
+        
+        Returns:
+            The (email agent, Notion agent) pair the run should use throughout
+        """
+        with self._agents_lock:
+            self._agent_users += 1
+            return self.email_agent, self.notion_agent
+    
+    def _release_agents(self) -> None:
+        """Unpin agents taken with `_acquire_agents`; close retired ones once unused."""
+        with self._agents_lock:
+            self._agent_users -= 1
+            retired = []
+            if self._agent_users == 0:
+                retired, self._retired_agents = self._retired_agents, []
+        for email_agent, notion_agent in retired:
+            email_agent.close()
+            notion_agent.close()
     
     async def _realtime_email_callback(self):
-        """Callback for real-time email processing."""
+        """
+        Callback for real-time email processing.
+        
+        Callbacks all run on the real-time processor's callback loop. The
+        first notification starts a drain that waits one debounce window
+        and runs the pipeline; notifications arriving meanwhile only flag
+        another pass, so a burst of N emails costs one or two runs, not N.
+        """
+        self.add_log_entry("INFO", "RealTime", "New email detected via IMAP IDLE")
+        self._realtime_pending = True
+        if self._realtime_draining:
+            return  # The running drain picks this notification up
+        
+        self._realtime_draining = True
         try:
-            self.add_log_entry("INFO", "RealTime", "New email detected via IMAP IDLE")
-            self.logger.info("Processing real-time email notification")
-            # Process emails immediately with smaller batch for speed
-            await self.process_email_to_notion_pipeline(email_limit=10, since_days=1)
-        except Exception as e:
-            self.add_log_entry("ERROR", "RealTime", f"Real-time processing error: {str(e)}")
-            self.logger.error(f"Real-time email processing error: {e}")
+            while self._realtime_pending:
+                await asyncio.sleep(self.realtime_debounce_window)
+                self._realtime_pending = False
+                try:
+                    self.logger.info("Processing real-time email notification")
+                    # Process emails immediately with smaller batch for speed
+                    await self.process_email_to_notion_pipeline(email_limit=10, since_days=1)
+                except Exception as e:
+                    self.add_log_entry("ERROR", "RealTime", f"Real-time processing error: {str(e)}")
+                    self.logger.error(f"Real-time email processing error: {e}")
+        finally:
+            self._realtime_draining = False
     
     def _start_realtime_delayed(self):
-        """Start real-time monitoring with a delay to allow initialization to complete."""
-        import time
-        time.sleep(2)  # Wait for initialization to complete
+        """Start real-time monitoring once initialization has completed (run from a timer)."""
         try:
             self.start_realtime_monitoring()
             self.add_log_entry("INFO", "RealTime", "IMAP IDLE monitoring started")
@@ -197,83 +329,147 @@ class AgentOrchestrator:
         4. Updates tracking data
         """
         self.logger.info("Starting email-to-notion pipeline")
+        new_tasks: List[Task] = []
         
+        # Use one agent pair for the whole run, even if the model is switched meanwhile
+        email_agent, notion_agent = self._acquire_agents()
         try:
-            # Step 1: Get new emails and extract tasks
+            # Steps 1 and 2 overlap: each batch of extracted tasks is created in
+            # Notion while the remaining emails are still being analyzed
             self.add_log_entry("INFO", "Pipeline", "Starting email processing")
-            new_tasks = await self.email_agent.process_new_emails(since_days=since_days, limit=email_limit)
+            page_ids: List[Optional[str]] = []
+            async for batch_tasks in email_agent.iter_new_tasks(since_days=since_days, limit=email_limit):
+                self.add_log_entry("INFO", "Email", f"Found {len(batch_tasks)} new tasks from emails")
+                
+                # Concurrent runs may have fetched the same unprocessed emails; skip theirs
+                batch_tasks = self._claim_tasks(batch_tasks)
+                if not batch_tasks:
+                    continue
+                new_tasks.extend(batch_tasks)
+                
+                self.add_log_entry("INFO", "Notion", f"Creating {len(batch_tasks)} tasks in Notion")
+                self.logger.info(f"🚀 Starting Notion batch creation for {len(batch_tasks)} tasks")
+                page_ids.extend(await notion_agent.batch_create_tasks(batch_tasks))
             
             if not new_tasks:
                 self.logger.info("No new tasks to process")
                 self.add_log_entry("INFO", "Pipeline", "No new emails to process")
                 return
             
-            self.add_log_entry("INFO", "Email", f"Found {len(new_tasks)} new tasks from emails")
+            # Step 3: Count successful creations and mark emails as processed
+            successful_tasks = [task for task, page_id in zip(new_tasks, page_ids) if page_id is not None]
+            created_count = len(successful_tasks)
+            skipped_count = len(new_tasks) - created_count
+            
+            # Lazy formatting: the title lists are only built when DEBUG is enabled
+            self.logger.opt(lazy=True).debug(
+                "✅ Created: {} | ⚠️ Skipped (duplicate or error): {}",
+                lambda: [task.title for task, page_id in zip(new_tasks, page_ids) if page_id is not None],
+                lambda: [task.title for task, page_id in zip(new_tasks, page_ids) if page_id is None]
+            )
+            
+            if successful_tasks:
+                # Mark the source emails as processed in one write, off the event loop
+                await asyncio.to_thread(email_agent.mark_tasks_as_processed, successful_tasks)
+                self.logger.info(f"📝 Marked {len(successful_tasks)} emails as processed")
+            
+            # Update stats with detailed counts
+            self.stats["tasks_created"] += created_count  # Only count actually created tasks
+            self.stats["emails_processed"] += len(new_tasks)  # Count all processed emails
+            now = datetime.now()
+            self.stats["last_run"] = now
+            self._last_run_iso = now.isoformat()
+            
+            # Broadcast stats update via WebSocket
+            self._broadcast_stats_update()
+            
+            # Add detailed log entries for the dashboard
+            self.add_log_entry("INFO", "Notion", f"Created {created_count} tasks in Notion")
+            if skipped_count > 0:
+                self.add_log_entry("INFO", "Notion", f"Skipped {skipped_count} duplicate tasks")
+            
+            self.add_log_entry("INFO", "Pipeline", f"Pipeline complete: {created_count}/{len(new_tasks)} tasks created, {skipped_count} skipped")
+            
+            self.logger.info(f"📊 Pipeline complete: {created_count}/{len(new_tasks)} tasks created, {skipped_count} skipped")
+            self.logger.info(f"📈 Total stats - Created: {self.stats['tasks_created']}, Processed: {self.stats['emails_processed']}, Errors: {self.stats['errors']}")
             
-            # Step 2: Create tasks in Notion
-            processing_lock = self._get_processing_lock()
-            async with processing_lock:
-                self.add_log_entry("INFO", "Notion", f"Creating {len(new_tasks)} tasks in Notion")
-                self.logger.info(f"🚀 Starting Notion batch creation for {len(new_tasks)} tasks")
-                page_ids = await self.notion_agent.batch_create_tasks(new_tasks)
-                
-                # Step 3: Count successful creations and mark emails as processed
-                successful_tasks = []
-                created_count = 0
-                skipped_count = 0
-                
-                for i, (task, page_id) in enumerate(zip(new_tasks, page_ids)):
-                    if page_id is not None:  # Task was successfully created
-                        successful_tasks.append(task)
-                        created_count += 1
-                        # Mark the source email as processed
-                        if task.source_id:
-                            self.email_agent.processed_emails.add(task.source_id)
-                        self.logger.debug(f"✅ Task {i+1}: '{task.title}' created successfully")
-                    else:
-                        skipped_count += 1
-                        self.logger.debug(f"⚠️ Task {i+1}: '{task.title}' skipped (duplicate or error)")
-                
-                # Save the updated processed emails
-                if successful_tasks:
-                    self.email_agent._save_processed_emails()
-                    self.logger.info(f"📝 Marked {len(successful_tasks)} emails as processed")
-                
-                # Update stats with detailed counts
-                self.stats["tasks_created"] += created_count  # Only count actually created tasks
-                self.stats["emails_processed"] += len(new_tasks)  # Count all processed emails
-                self.stats["last_run"] = datetime.now()
-                
-                # Broadcast stats update via WebSocket
-                self._broadcast_stats_update()
-                
-                # Add detailed log entries for the dashboard
-                self.add_log_entry("INFO", "Notion", f"Created {created_count} tasks in Notion")
-                if skipped_count > 0:
-                    self.add_log_entry("INFO", "Notion", f"Skipped {skipped_count} duplicate tasks")
-                
-                self.add_log_entry("INFO", "Pipeline", f"Pipeline complete: {created_count}/{len(new_tasks)} tasks created, {skipped_count} skipped")
-                
-                self.logger.info(f"📊 Pipeline complete: {created_count}/{len(new_tasks)} tasks created, {skipped_count} skipped")
-                self.logger.info(f"📈 Total stats - Created: {self.stats['tasks_created']}, Processed: {self.stats['emails_processed']}, Errors: {self.stats['errors']}")
-                
         except Exception as e:
             self.stats["errors"] += 1
             self._broadcast_stats_update()  # Broadcast error count update
             self.add_log_entry("ERROR", "Pipeline", f"Pipeline error: {str(e)}")
             self.logger.error(f"❌ Pipeline error: {e}")
             raise
+        finally:
+            # Emails are marked processed by now (or left for a retry on failure)
+            self._release_tasks(new_tasks)
+            self._release_agents()
     
     def _broadcast_stats_update(self):
         """Broadcast stats update to WebSocket clients."""
         if self.websocket_manager:
             try:
-                # Use get_system_stats() to handle datetime serialization
-                system_stats = self.get_system_stats()
-                asyncio.create_task(self.websocket_manager.send_stats_update(system_stats))
+                if self._can_coalesce_broadcasts():
+                    # Several updates within one window collapse into a single snapshot
+                    with self._broadcast_lock:
+                        if self._stats_flush_scheduled:
+                            return
+                        self._stats_flush_scheduled = True
+                    self.websocket_loop.call_soon_threadsafe(
+                        self.websocket_loop.call_later, self.broadcast_window, self._flush_stats_broadcast
+                    )
+                else:
+                    # Use get_system_stats() to handle datetime serialization
+                    system_stats = self.get_system_stats()
+                    self._schedule_broadcast(self.websocket_manager.send_stats_update(system_stats))
             except Exception:
                 pass  # Don't let WebSocket issues break the pipeline
     
+    def _start_broadcast_task(self, loop: asyncio.AbstractEventLoop, coro) -> None:
+        """Start a fire-and-forget broadcast task, keeping it referenced until it finishes."""
+        task = loop.create_task(coro)
+        self._broadcast_tasks.add(task)
+        task.add_done_callback(self._broadcast_tasks.discard)
+    
+    def _can_coalesce_broadcasts(self) -> bool:
+        """Whether broadcasts can be deferred onto the API server's running loop."""
+        return self.websocket_loop is not None and self.websocket_loop.is_running()
+    
+    def _queue_log_broadcast(self, entry: dict) -> None:
+        """Queue a log entry for the next batched WebSocket broadcast."""
+        if not (self._can_coalesce_broadcasts() and hasattr(self.websocket_manager, 'send_log_batch')):
+            self._schedule_broadcast(self.websocket_manager.send_log_update(entry))
+            return
+        
+        with self._broadcast_lock:
+            self._pending_logs.append(entry)
+            if self._log_flush_scheduled:
+                return
+            self._log_flush_scheduled = True
+        self.websocket_loop.call_soon_threadsafe(
+            self.websocket_loop.call_later, self.broadcast_window, self._flush_log_broadcast
+        )
+    
+    def _flush_log_broadcast(self) -> None:
+        """Send all queued log entries in one message (runs on the WebSocket loop)."""
+        with self._broadcast_lock:
+            entries = self._pending_logs
+            self._pending_logs = []
+            self._log_flush_scheduled = False
+        if entries:
+            self._start_broadcast_task(self.websocket_loop, self.websocket_manager.send_log_batch(entries))
+    
+    def _flush_stats_broadcast(self) -> None:
+        """Send one stats snapshot for all updates in the window (runs on the WebSocket loop)."""
+        with self._broadcast_lock:
+            self._stats_flush_scheduled = False
+        if not getattr(self.websocket_manager, 'active_connections', True):
+            return  # Nobody is listening; skip building and encoding the snapshot
+        try:
+            system_stats = self.get_system_stats()
+            self._start_broadcast_task(self.websocket_loop, self.websocket_manager.send_stats_update(system_stats))
+        except Exception:
+            pass  # Don't let WebSocket issues break the pipeline
+    
     async def run_single_cycle(self, email_limit: Optional[int] = None, since_days: Optional[int] = None) -> None:
         """
         Run a single processing cycle.
@@ -295,53 +491,91 @@ class AgentOrchestrator:
         except Exception as e:
             self.logger.error(f"Cycle error: {e}")
     
-    def schedule_background_tasks(self) -> None:
-        """Set up background task scheduling."""
+    async def run_background_tasks(self) -> None:
+        """
+        Run the scheduled background tasks until cancelled.
+        
+        Everything runs on the current event loop, so the AI provider HTTP
+        clients stay bound to one loop for the lifetime of background mode.
+        """
         if not settings.enable_background_tasks:
             self.logger.info("Background tasks disabled")
             return
         
-        # Schedule email processing every N minutes
-        interval_minutes = getattr(self, 'check_interval_minutes', settings.email_check_interval // 60)
-        schedule.every(interval_minutes).minutes.do(
-            lambda: asyncio.run(self.run_single_cycle_with_config())
+        # Email processing every N minutes
+        interval_minutes = max(1, self.check_interval_minutes)
+        self.logger.info(f"Scheduled background tasks (interval: {interval_minutes} minutes)")
+        
+        # Jitter keeps several deployments from hitting IMAP and Notion in lockstep
+        await asyncio.gather(
+            self._run_periodically(interval_minutes * 60, self.run_single_cycle_with_config, jitter=0.1),
+            # Daily cleanup around 2 AM
+            self._run_daily_at("02:00", self.cleanup_old_data, jitter_minutes=15)
         )
+    
+    async def _run_periodically(self, interval_seconds: float, job, jitter: float = 0.0) -> None:
+        """
+        Await `job()` every `interval_seconds`, starting one interval from now.
         
-        # Schedule daily cleanup at 2 AM
-        schedule.every().day.at("02:00").do(self.cleanup_old_data)
+        Args:
+            interval_seconds: Nominal delay between the end of one run and the next
+            job: Coroutine function to await
+            jitter: Fraction of the interval to randomly add or subtract, re-drawn every run
+        """
+        while True:
+            await asyncio.sleep(interval_seconds * (1 + random.uniform(-jitter, jitter)))
+            await job()
+    
+    async def _run_daily_at(self, time_of_day: str, job, jitter_minutes: int = 0) -> None:
+        """
+        Run the blocking `job()` once a day at `time_of_day` (HH:MM, local time).
         
-        self.logger.info(f"Scheduled background tasks (interval: {interval_minutes} minutes)")
+        Args:
+            time_of_day: Nominal run time
+            job: Blocking function, run in a worker thread
+            jitter_minutes: Random offset (in either direction) applied to each day's run
+        """
+        hour, minute = map(int, time_of_day.split(":"))
+        now = datetime.now()
+        nominal = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        while True:
+            # Advance from the nominal time, not from the (jittered) last run, so an
+            # early run doesn't find the same day's slot still ahead and run twice
+            while nominal <= now:
+                nominal += timedelta(days=1)
+            next_run = nominal + timedelta(minutes=random.uniform(-jitter_minutes, jitter_minutes))
+            await asyncio.sleep(max(0.0, (next_run - now).total_seconds()))
+            await asyncio.to_thread(job)
+            now = max(datetime.now(), nominal)
     
     def cleanup_old_data(self) -> None:
         """Clean up old processed email data."""
         try:
-            # This would clean up old processed email IDs
-            # Keep only last 30 days of data
             self.logger.info("Cleaning up old data")
+            email_agent, _ = self._acquire_agents()
+            try:
+                email_agent.prune_processed_emails()
+            finally:
+                self._release_agents()
             
         except Exception as e:
             self.logger.error(f"Cleanup error: {e}")
     
     def get_system_stats(self) -> dict:
         """Get current system statistics."""
-        uptime = datetime.now() - self.stats["uptime_start"]
+        uptime_seconds = time.monotonic() - self._uptime_start_monotonic
         
         # Get real-time email status
         realtime_status = self.get_realtime_status()
         
-        # Serialize datetime objects for safe JSON transmission
-        serialized_stats = {}
-        for key, value in self.stats.items():
-            if isinstance(value, datetime):
-                serialized_stats[key] = value.isoformat()
-            else:
-                serialized_stats[key] = value
-        
+        # Serialize the datetime fields for safe JSON transmission
         return {
-            **serialized_stats,
+            **self.stats,
+            "last_run": self._last_run_iso,
+            "uptime_start": self._uptime_start_iso,
             "processed_emails_count": self.email_agent.get_processed_email_count() if self.email_agent else 0,
-            "uptime_seconds": uptime.total_seconds(),
-            "uptime_hours": uptime.total_seconds() / 3600,
+            "uptime_seconds": uptime_seconds,
+            "uptime_hours": uptime_seconds / 3600,
             "queue_size": len(self.task_queue),
             "email_agent_status": "active",
             "notion_agent_status": "active",
@@ -358,25 +592,34 @@ class AgentOrchestrator:
         try:
             self.logger.info(f"Switching model from {self.model} to {new_model}")
             
-            # Update the orchestrator's model
-            old_model = self.model
-            self.model = new_model
+            # Build the replacement agents without touching the current ones
+            new_notion_agent = NotionAgent(model=new_model)
             
-            # Reinitialize agents with the new model
-            from agents.email_polling import EmailAgent
-            from agents.notion_integration import NotionAgent
+            # Validate the Notion database setup before committing to the switch;
+            # on failure the current agents stay attached and the new client is closed
+            try:
+                if not new_notion_agent.validate_database_setup():
+                    self.logger.error(f"Notion database validation failed with new model {new_model}, keeping {self.model}")
+                    raise ValueError(f"Notion database validation failed with model {new_model}")
+                
+                new_email_agent = EmailAgent(model=new_model)
+            except Exception:
+                new_notion_agent.close()
+                raise
             
-            self.email_agent = EmailAgent(model=new_model)
-            self.notion_agent = NotionAgent(model=new_model)
+            with self._agents_lock:
+                retired = (self.email_agent, self.notion_agent)
+                self.model = new_model
+                self.email_agent, self.notion_agent = new_email_agent, new_notion_agent
+                # Runs still using the replaced agents close them when they finish
+                in_use = self._agent_users > 0
+                if in_use:
+                    self._retired_agents.append(retired)
             
-            # Validate the Notion database setup with the new agent
-            if not self.notion_agent.validate_database_setup():
-                # If validation fails, roll back to the old model
-                self.logger.error(f"Notion database validation failed with new model {new_model}, rolling back")
-                self.model = old_model
-                self.email_agent = EmailAgent(model=old_model)
-                self.notion_agent = NotionAgent(model=old_model)
-                raise ValueError(f"Notion database validation failed with model {new_model}")
+            # Release the replaced agents' IMAP connection, SQLite handles and HTTP pool
+            if not in_use:
+                retired[0].close()
+                retired[1].close()
             
             # Add log entry for successful switch
             self.add_log_entry("INFO", "System", f"Model switched to {new_model}")
@@ -391,18 +634,13 @@ class AgentOrchestrator:
         """Run the orchestrator in background mode with scheduling."""
         self.logger.info("Starting background mode")
         
-        # Set up scheduling
-        self.schedule_background_tasks()
-        
-        # Main loop
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-                
+            asyncio.run(self.run_background_tasks())
+            
         except KeyboardInterrupt:
             self.logger.info("Shutting down gracefully...")
-            self.executor.shutdown(wait=True)
+            self.email_agent.close()
+            self.notion_agent.close()
         except Exception as e:
             self.logger.error(f"Background mode error: {e}")
             raise
@@ -427,6 +665,7 @@ class AgentOrchestrator:
         try:
             if self.realtime_processor:
                 self.realtime_processor.start_idle_monitoring()
+                self._realtime_status_cache = (0.0, None)  # Report the change right away
                 self.logger.info("Real-time email monitoring started")
         except Exception as e:
             self.logger.error(f"Failed to start real-time monitoring: {e}")
@@ -436,14 +675,26 @@ class AgentOrchestrator:
         try:
             if self.realtime_processor:
                 self.realtime_processor.stop_idle_monitoring()
+                self._realtime_status_cache = (0.0, None)  # Report the change right away
                 self.logger.info("Real-time email monitoring stopped")
         except Exception as e:
             self.logger.error(f"Failed to stop real-time monitoring: {e}")
     
     def get_realtime_status(self) -> dict:
-        """Get real-time monitoring status."""
+        """
+        Get real-time monitoring status.
+        
+        Stats broadcasts and health checks can ask many times a second; the
+        processor is queried at most once per `realtime_status_ttl` (its
+        IDLE capability probe opens an IMAP session until it succeeds).
+        """
         if self.realtime_processor:
-            return self.realtime_processor.get_status()
+            now = time.monotonic()
+            cached_at, status = self._realtime_status_cache
+            if status is None or now - cached_at >= self.realtime_status_ttl:
+                status = self.realtime_processor.get_status()
+                self._realtime_status_cache = (now, status)
+            return status
         return {"idle_running": False, "idle_thread_alive": False, "last_idle_restart": None, "idle_supported": False}
     
     def configure_email_processing(self, email_limit: int = 50, since_days: int = 7, check_interval_minutes: int = 5):
@@ -463,29 +714,36 @@ class AgentOrchestrator:
     
     async def run_single_cycle_with_config(self) -> None:
         """Run a single cycle using configured parameters."""
-        email_limit = getattr(self, 'email_limit', 50)
-        since_days = getattr(self, 'since_days', 7)
-        
-        await self.run_single_cycle(email_limit=email_limit, since_days=since_days)
+        await self.run_single_cycle(email_limit=self.email_limit, since_days=self.since_days)
 
 
-def format_log_record(record):
-    """Custom formatter that safely handles missing component field."""
-    component = record["extra"].get("component", "main")
-    return f"{record['time']} | {record['level']} | {component} | {record['message']}\n"
+# Static template compiled once by loguru; `component` defaults to "main" via logger.configure()
+LOG_FORMAT = "{time} | {level} | {extra[component]} | {message}"
+
+def install_fast_event_loop() -> None:
+    """Use uvloop for all event loops created from here on, if it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+    logger.bind(component="main").info("Using uvloop event loop")
+
 
 def main():
     """Main entry point for the application."""
     # Configure logging
+    logger.configure(extra={"component": "main"})
     logger.add(
         "logs/agents.log",
         rotation="1 day",
         retention="30 days",
         level=settings.log_level,
-        format=format_log_record
+        format=LOG_FORMAT
     )
     
     logger.bind(component="main").info("Starting AI Agents Swarm")
+    install_fast_event_loop()
     
     try:
         orchestrator = AgentOrchestrator()
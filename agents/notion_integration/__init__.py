@@ -13,16 +13,71 @@ Key features:
 """
 
 import asyncio
-from typing import List, Optional, Dict, Any
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+import httpx
 from notion_client import Client
 from notion_client.errors import APIResponseError
 from fuzzywuzzy import fuzz
 
 # Internal imports
 from agents.core import BaseAgent, Task, TaskPriority, TaskStatus
+from agents.notion_integration.rate_limiter import RateLimiter
 from config.settings import settings
 
+# Notion's limits apply per integration, so every NotionAgent shares one bucket
+NOTION_RATE_LIMITER = RateLimiter(rate=settings.notion_requests_per_second, burst=3)
+
+# Task enums to the option names used by the Notion database
+PRIORITY_TO_NOTION = {
+    TaskPriority.LOW: "Low",
+    TaskPriority.MEDIUM: "Medium",
+    TaskPriority.HIGH: "High",
+    TaskPriority.URGENT: "High"  # Map urgent to high since your DB doesn't have urgent
+}
+STATUS_TO_NOTION = {
+    TaskStatus.TODO: "Not started",
+    TaskStatus.IN_PROGRESS: "In progress",
+    TaskStatus.DONE: "Done",
+    TaskStatus.CANCELLED: "Not started"  # Map cancelled to not started
+}
+
+# Fixed properties every new task gets
+DEFAULT_TASK_TYPE_PROPERTY = {"multi_select": [{"name": "💬 Feature request"}]}
+DEFAULT_EFFORT_LEVEL_PROPERTY = {"select": {"name": "Medium"}}
+
+# Properties the database must have, matching the Tasks Tracker schema, with their types
+REQUIRED_PROPERTIES = {
+    "Task name": "title",
+    "Status": "status",  # Notion uses "status" type, not "select"
+    "Priority": "select",
+    "Description": "rich_text"
+}
+
+# Optional rich text column holding Task.source_id (e.g. the email Message-ID)
+SOURCE_ID_PROPERTY = "Source ID"
+
+# Number of most recently created tasks a new task is compared against for duplicates
+DUPLICATE_CHECK_WINDOW = 20
+
+# Largest page_size databases.query accepts
+NOTION_MAX_PAGE_SIZE = 100
+
+# How long the duplicate-check window is reused before Notion is queried again
+RECENT_TASKS_TTL_SECONDS = 60.0
+
+# How long a fetched database schema is reused
+SCHEMA_CACHE_TTL_SECONDS = 300.0
+
+# How long idle connections to api.notion.com are kept for reuse
+NOTION_KEEPALIVE_SECONDS = 60.0
+
+# Retries for a request Notion rejects with HTTP 429 before the error is raised
+NOTION_MAX_RETRIES = 3
+
 
 class NotionAgent(BaseAgent):
     """
@@ -30,56 +85,197 @@ class NotionAgent(BaseAgent):
     
     This agent creates and manages tasks in Notion databases,
     providing a clean interface between the AI agents and Notion.
+    
+    The agent owns a pooled HTTP client; call `close()` when done, or use
+    it as a context manager (`with NotionAgent() as agent:` or
+    `async with NotionAgent() as agent:`).
     """
     
     def __init__(self, model: Optional[str] = None):
         """Initialize the Notion agent with API credentials."""
         super().__init__(name="NotionAgent", model=model)
-        self.client = Client(auth=settings.notion_api_key)
+        
+        # One pooled HTTP client for every Notion call; idle connections stay open
+        # between pipeline batches instead of expiring after httpx's 5s default
+        pool_size = max(1, settings.notion_concurrency) + 2  # Headroom for dashboard/API calls
+        self._http = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=pool_size,
+                max_keepalive_connections=pool_size,
+                keepalive_expiry=NOTION_KEEPALIVE_SECONDS
+            )
+        )
+        self.client = Client(auth=settings.notion_api_key, client=self._http)
         self.database_id = settings.notion_database_id
         
-        # Test connection
+        # Cached duplicate-check window: (title, description) of the newest tasks
+        self._recent_tasks: Optional[List[Tuple[str, str]]] = None
+        self._recent_tasks_at = 0.0
+        self._recent_tasks_lock = threading.Lock()
+        
+        # (monotonic fetch time, properties) of the database schema
+        self._schema_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # Test connection (the response also primes the schema cache for validation)
         try:
-            self.client.databases.retrieve(database_id=self.database_id)
+            response = self._request(self.client.databases.retrieve, database_id=self.database_id)
+            self._schema_cache = (time.monotonic(), response.get("properties", {}))
             self.logger.info("Successfully connected to Notion database")
         except APIResponseError as e:
             self.log_error(e, "Connecting to Notion database")
             raise
     
+    def close(self) -> None:
+        """Close the pooled HTTP connections to Notion."""
+        self._http.close()
+    
+    def __enter__(self) -> "NotionAgent":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "NotionAgent":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _request(self, method: Callable[..., Any], **kwargs) -> Any:
+        """
+        Call a Notion client method through the shared rate limiter.
+        
+        Requests rejected as rate limited (HTTP 429) are retried after the
+        server's Retry-After delay, or with exponential backoff without one.
+        
+        Args:
+            method: Bound Notion client endpoint (e.g. `self.client.pages.create`)
+            **kwargs: Arguments for the endpoint
+            
+        Returns:
+            The endpoint's response
+        """
+        for attempt in range(NOTION_MAX_RETRIES + 1):
+            NOTION_RATE_LIMITER.acquire()
+            try:
+                return method(**kwargs)
+            except APIResponseError as e:
+                if e.status != 429 or attempt == NOTION_MAX_RETRIES:
+                    raise
+                retry_after = e.headers.get("retry-after")
+                delay = float(retry_after) if retry_after else 2 ** attempt
+                self.logger.warning(f"Notion rate limit hit, retrying in {delay:.1f}s")
+                time.sleep(delay)
+    
+    def _query_pages(self, max_results: Optional[int] = None, **query) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the pages matching a database query, following pagination cursors.
+        
+        Each request asks for no more pages than are still wanted, and
+        iteration stops as soon as `max_results` pages have been yielded.
+        
+        Args:
+            max_results: Maximum number of pages to yield (None for all)
+            **query: databases.query arguments such as `filter` and `sorts`
+            
+        Yields:
+            Notion page objects
+        """
+        remaining = max_results
+        start_cursor = None
+        while remaining is None or remaining > 0:
+            page_size = NOTION_MAX_PAGE_SIZE if remaining is None else min(remaining, NOTION_MAX_PAGE_SIZE)
+            if start_cursor:
+                query["start_cursor"] = start_cursor
+            response = self._request(
+                self.client.databases.query,
+                database_id=self.database_id,
+                page_size=page_size,
+                **query
+            )
+            
+            results = response.get("results", [])
+            yield from results
+            if remaining is not None:
+                remaining -= len(results)
+            
+            start_cursor = response.get("next_cursor")
+            if not response.get("has_more") or not start_cursor:
+                return
+    
     def _priority_to_notion_select(self, priority: TaskPriority) -> str:
         """Convert TaskPriority enum to Notion select option."""
-        priority_map = {
-            TaskPriority.LOW: "Low",
-            TaskPriority.MEDIUM: "Medium", 
-            TaskPriority.HIGH: "High",
-            TaskPriority.URGENT: "High"  # Map urgent to high since your DB doesn't have urgent
-        }
-        return priority_map.get(priority, "Medium")
+        return PRIORITY_TO_NOTION.get(priority, "Medium")
     
     def _status_to_notion_select(self, status: TaskStatus) -> str:
         """Convert TaskStatus enum to Notion select option."""
-        status_map = {
-            TaskStatus.TODO: "Not started",
-            TaskStatus.IN_PROGRESS: "In progress",
-            TaskStatus.DONE: "Done",
-            TaskStatus.CANCELLED: "Not started"  # Map cancelled to not started
-        }
-        return status_map.get(status, "Not started")
+        return STATUS_TO_NOTION.get(status, "Not started")
     
-    def _task_exists(self, task: Task, similarity_threshold: int = 85) -> bool:
+    def _similarity(self, task: Task, other_title: str, other_description: str = "") -> Tuple[int, int]:
         """
-        Check if a task with similar title or content already exists in Notion.
+        Fuzzy-match a task against another task's title and description.
         
         Args:
-            task: Task to check for duplicates
-            similarity_threshold: Minimum similarity percentage to consider as duplicate (default: 85%)
+            task: Task being checked
+            other_title: Title to compare against
+            other_description: Description to compare against (optional)
             
         Returns:
-            True if similar task exists, False otherwise
+            (title similarity, description similarity) as percentages
+        """
+        title_similarity = fuzz.ratio(task.title.lower(), other_title.lower())
+        description_similarity = 0
+        if task.description and other_description:
+            description_similarity = fuzz.ratio(task.description.lower(), other_description.lower())
+        return title_similarity, description_similarity
+    
+    def _find_batch_duplicates(self, tasks: List[Task], similarity_threshold: int = 85) -> List[bool]:
         """
+        Flag tasks that closely match an earlier task in the same batch.
+        
+        Batch tasks are created concurrently, so they can't see each other
+        through the Notion duplicate check; compare them locally instead.
+        
+        Args:
+            tasks: Tasks about to be created together
+            similarity_threshold: Minimum similarity percentage to consider as duplicate
+            
+        Returns:
+            One flag per task, True for duplicates of an earlier task
+        """
+        flags = []
+        kept: List[Task] = []
+        for task in tasks:
+            duplicate = any(
+                max(self._similarity(task, other.title, other.description)) >= similarity_threshold
+                for other in kept
+            )
+            if not duplicate:
+                kept.append(task)
+            flags.append(duplicate)
+        return flags
+    
+    def _get_recent_tasks_for_dedup(self) -> List[Tuple[str, str]]:
+        """
+        Fetch the titles and descriptions of the most recently created tasks.
+        
+        One query serves the duplicate checks of a whole batch of tasks. The
+        result is cached for RECENT_TASKS_TTL_SECONDS and kept current with
+        the tasks this agent creates, so the batches of one pipeline run
+        share a single query; tasks added by other Notion users show up once
+        the cache expires.
+        
+        Returns:
+            (title, description) pairs, newest first; empty if the query fails
+        """
+        with self._recent_tasks_lock:
+            if self._recent_tasks is not None and time.monotonic() - self._recent_tasks_at < RECENT_TASKS_TTL_SECONDS:
+                return list(self._recent_tasks)
+        
         try:
             # Query the database for recent tasks to compare
-            response = self.client.databases.query(
+            response = self._request(
+                self.client.databases.query,
                 database_id=self.database_id,
                 sorts=[
                     {
@@ -87,57 +283,87 @@ class NotionAgent(BaseAgent):
                         "direction": "descending"
                     }
                 ],
-                page_size=20  # Check last 20 tasks for duplicates
+                page_size=DUPLICATE_CHECK_WINDOW
             )
+        except Exception as e:
+            self.logger.error(f"Error checking for duplicate task: {e}")
+            # If we can't check, assume nothing exists to avoid blocking task creation
+            return []
+        
+        recent_tasks = []
+        for existing_task in response.get("results", []):
+            properties = existing_task.get("properties", {})
             
-            results = response.get("results", [])
-            if not results:
-                self.logger.debug(f"No existing tasks found to compare with '{task.title}'")
-                return False
-            
-            # Check for similarity with existing tasks
-            for existing_task in results:
-                properties = existing_task.get("properties", {})
+            # Get existing task title
+            title_prop = properties.get("Task name", {})
+            if title_prop.get("type") == "title" and title_prop.get("title"):
+                # plain_text is present on every rich text item, including mentions and equations
+                existing_title = self._extract_title(title_prop)
                 
-                # Get existing task title
-                title_prop = properties.get("Task name", {})
-                if title_prop.get("type") == "title" and title_prop.get("title"):
-                    existing_title = title_prop["title"][0]["text"]["content"]
-                    
-                    # Calculate title similarity
-                    title_similarity = fuzz.ratio(task.title.lower(), existing_title.lower())
-                    
-                    # Also check description similarity if available
-                    description_similarity = 0
-                    if task.description:
-                        desc_prop = properties.get("Description", {})
-                        if desc_prop.get("type") == "rich_text" and desc_prop.get("rich_text"):
-                            existing_desc = desc_prop["rich_text"][0]["text"]["content"]
-                            description_similarity = fuzz.ratio(task.description.lower(), existing_desc.lower())
-                    
-                    # Use the higher similarity score
-                    max_similarity = max(title_similarity, description_similarity)
-                    
-                    self.logger.debug(f"Similarity check: '{task.title}' vs '{existing_title}' = {title_similarity}% (desc: {description_similarity}%)")
-                    
-                    if max_similarity >= similarity_threshold:
-                        self.logger.info(f"Found similar task: '{existing_title}' (similarity: {max_similarity}%)")
-                        return True
+                # Also keep the description for similarity checks if available
+                existing_desc = ""
+                desc_prop = properties.get("Description", {})
+                if desc_prop.get("type") == "rich_text":
+                    existing_desc = self._extract_rich_text(desc_prop)
+                
+                recent_tasks.append((existing_title, existing_desc))
+        
+        with self._recent_tasks_lock:
+            self._recent_tasks = recent_tasks
+            self._recent_tasks_at = time.monotonic()
+        return list(recent_tasks)
+    
+    def _remember_created_task(self, task: Task) -> None:
+        """Add a task this agent just created to the cached duplicate-check window."""
+        with self._recent_tasks_lock:
+            if self._recent_tasks is not None:
+                self._recent_tasks = [(task.title, task.description)] + self._recent_tasks[:DUPLICATE_CHECK_WINDOW - 1]
+    
+    def _task_exists(self, task: Task, similarity_threshold: int = 85,
+                     recent_tasks: Optional[List[Tuple[str, str]]] = None) -> bool:
+        """
+        Check if a task with similar title or content already exists in Notion.
+        
+        Args:
+            task: Task to check for duplicates
+            similarity_threshold: Minimum similarity percentage to consider as duplicate (default: 85%)
+            recent_tasks: Result of `_get_recent_tasks_for_dedup`, fetched here if None
             
-            self.logger.debug(f"No similar tasks found for '{task.title}'")
+        Returns:
+            True if similar task exists, False otherwise
+        """
+        if recent_tasks is None:
+            recent_tasks = self._get_recent_tasks_for_dedup()
+        
+        if not recent_tasks:
+            self.logger.debug("No existing tasks found to compare with '{}'", task.title)
             return False
+        
+        # Check for similarity with existing tasks
+        for existing_title, existing_desc in recent_tasks:
+            title_similarity, description_similarity = self._similarity(task, existing_title, existing_desc)
             
-        except Exception as e:
-            self.logger.error(f"Error checking for duplicate task: {e}")
-            # If we can't check, assume it doesn't exist to avoid blocking task creation
-            return False
+            # Use the higher similarity score
+            max_similarity = max(title_similarity, description_similarity)
+            
+            self.logger.debug("Similarity check: '{}' vs '{}' = {}% (desc: {}%)", task.title, existing_title, title_similarity, description_similarity)
+            
+            if max_similarity >= similarity_threshold:
+                self.logger.info(f"Found similar task: '{existing_title}' (similarity: {max_similarity}%)")
+                return True
+        
+        self.logger.debug("No similar tasks found for '{}'", task.title)
+        return False
     
-    def create_task_in_notion(self, task: Task) -> Optional[str]:
+    def create_task_in_notion(self, task: Task,
+                              recent_tasks: Optional[List[Tuple[str, str]]] = None) -> Optional[str]:
         """
         Create a new task in the Notion database.
         
         Args:
             task: Task object to create in Notion
+            recent_tasks: Recently created tasks to check for duplicates against
+                (see `_get_recent_tasks_for_dedup`); queried if None
             
         Returns:
             Notion page ID if successful, None otherwise
@@ -146,154 +372,183 @@ class NotionAgent(BaseAgent):
             self.logger.info(f"Creating Notion task: {task.title}")
             
             # Check for duplicate tasks first
-            duplicate_exists = self._task_exists(task)
-            self.logger.debug(f"Duplicate check for '{task.title}': {duplicate_exists}")
+            duplicate_exists = self._task_exists(task, recent_tasks=recent_tasks)
+            self.logger.debug("Duplicate check for '{}': {}", task.title, duplicate_exists)
             
             if duplicate_exists:
                 self.logger.warning(f"Task '{task.title}' already exists in Notion, skipping creation")
                 return None
             
-            # Prepare the page properties to match your database schema
-            properties = {
-                "Task name": {
-                    "title": [
+            # Assemble the full payload (properties + content blocks) in memory
+            page = self.build_page(task)
+            
+            # Create the page with detailed logging
+            self.logger.debug("Sending create request to Notion for task: {}", task.title)
+            response = self._request(self.client.pages.create, **page)
+            
+            page_id = response["id"]
+            self._remember_created_task(task)
+            self.logger.info(f"✅ Successfully created Notion task: {task.title} (ID: {page_id})")
+            return page_id
+            
+        except APIResponseError as e:
+            self.logger.error(f"❌ API Error creating Notion task '{task.title}': {e}")
+            self.log_error(e, f"Creating Notion task: {task.title}")
+            return None
+        except Exception as e:
+            self.logger.error(f"❌ Unexpected error creating Notion task '{task.title}': {e}")
+            return None
+    
+    def build_page(self, task: Task) -> Dict[str, Any]:
+        """
+        Assemble the complete `pages.create` payload for a task.
+        
+        Pure in-memory work with no Notion requests beyond the cached
+        schema, so ingestion scripts can prepare many pages up front and
+        hand them to `create_prepared_pages`.
+        
+        Args:
+            task: Task to convert
+            
+        Returns:
+            Keyword arguments for `pages.create` (parent, properties, children)
+        """
+        # Create the page with minimal content since we have description in properties
+        children = []
+        
+        # Add source information as content
+        if task.source:
+            children.append({
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {
+                    "rich_text": [
                         {
+                            "type": "text",
                             "text": {
-                                "content": task.title
+                                "content": f"Source: {task.source}"
                             }
                         }
                     ]
-                },
-                "Status": {
-                    "status": {
-                        "name": self._status_to_notion_select(task.status)
-                    }
-                },
-                "Priority": {
-                    "select": {
-                        "name": self._priority_to_notion_select(task.priority)
-                    }
-                },
-                "Description": {
+                }
+            })
+        
+        # Add metadata if available, as collapsible JSON
+        if task.metadata:
+            children.append({
+                "object": "block",
+                "type": "toggle",
+                "toggle": {
                     "rich_text": [
                         {
+                            "type": "text",
                             "text": {
-                                "content": task.description
+                                "content": "Metadata"
                             }
                         }
-                    ]
-                },
-                "Task type": {
-                    "multi_select": [
+                    ],
+                    "children": [
                         {
-                            "name": "💬 Feature request"  # Default task type as multi_select
+                            "object": "block",
+                            "type": "code",
+                            "code": {
+                                "language": "json",
+                                "rich_text": [
+                                    {
+                                        "type": "text",
+                                        "text": {
+                                            "content": json.dumps(task.metadata, indent=2, default=str, ensure_ascii=False)
+                                        }
+                                    }
+                                ]
+                            }
                         }
                     ]
-                },
-                "Effort level": {
-                    "select": {
-                        "name": "Medium"  # Default effort level
-                    }
                 }
-            }
-            
-            # Add due date if provided
-            if task.due_date:
-                properties["Due date"] = {
-                    "date": {
-                        "start": task.due_date.isoformat()
-                    }
-                }
-            
-            # Create the page with minimal content since we have description in properties
-            children = []
-            
-            # Add source information as content
-            if task.source:
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": f"Source: {task.source}"
-                                }
-                            }
-                        ]
-                    }
-                })
-            
-            # Add metadata if available
-            if task.metadata:
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": f"Metadata: {task.metadata}"
-                                }
-                            }
-                        ]
-                    }
-                })
-            if task.metadata:
-                children.append({
-                    "object": "block",
-                    "type": "toggle",
-                    "toggle": {
-                        "rich_text": [
-                            {
-                                "type": "text",
-                                "text": {
-                                    "content": "Metadata"
-                                }
-                            }
-                        ],
-                        "children": [
-                            {
-                                "object": "block",
-                                "type": "code",
-                                "code": {
-                                    "language": "json",
-                                    "rich_text": [
-                                        {
-                                            "type": "text",
-                                            "text": {
-                                                "content": str(task.metadata)
-                                            }
-                                        }
-                                    ]
-                                }
-                            }
-                        ]
-                    }
-                })
-            
-            # Create the page with detailed logging
-            self.logger.debug(f"Sending create request to Notion for task: {task.title}")
-            response = self.client.pages.create(
-                parent={"database_id": self.database_id},
-                properties=properties,
-                children=children
-            )
-            
-            page_id = response["id"]
-            self.logger.info(f"✅ Successfully created Notion task: {task.title} (ID: {page_id})")
-            return page_id
+            })
+        
+        return {
+            "parent": {"database_id": self.database_id},
+            "properties": self._build_properties(task),
+            "children": children
+        }
+    
+    def create_prepared_page(self, page: Dict[str, Any]) -> Optional[str]:
+        """
+        Create a page from a payload built with `build_page`.
+        
+        Unlike `create_task_in_notion` there is no duplicate check; the
+        request still goes through the shared rate limiter.
+        
+        Args:
+            page: Payload returned by `build_page`
             
-        except APIResponseError as e:
-            self.logger.error(f"❌ API Error creating Notion task '{task.title}': {e}")
-            self.log_error(e, f"Creating Notion task: {task.title}")
-            return None
+        Returns:
+            Notion page ID if successful, None otherwise
+        """
+        try:
+            return self._request(self.client.pages.create, **page)["id"]
         except Exception as e:
-            self.logger.error(f"❌ Unexpected error creating Notion task '{task.title}': {e}")
+            self.log_error(e, "Creating prepared Notion page")
             return None
     
+    async def create_prepared_pages(self, pages: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Create several prepared pages concurrently, without duplicate checks.
+        
+        Args:
+            pages: Payloads returned by `build_page`
+            
+        Returns:
+            Notion page IDs in input order (None for failed creations)
+        """
+        semaphore = asyncio.Semaphore(max(1, settings.notion_concurrency))
+        
+        async def create_one(page: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                return await asyncio.to_thread(self.create_prepared_page, page)
+        
+        page_ids = await asyncio.gather(*(create_one(page) for page in pages))
+        successful_creates = sum(1 for pid in page_ids if pid is not None)
+        self.logger.info(f"📊 Prepared page creation complete: {successful_creates}/{len(pages)} pages created")
+        return list(page_ids)
+    
+    def _build_properties(self, task: Task) -> Dict[str, Any]:
+        """
+        Build the Notion page properties for a task.
+        
+        Constant sub-payloads (default task type and effort level) are
+        shared module-level objects; they are only serialized, never mutated.
+        
+        Args:
+            task: Task to convert
+            
+        Returns:
+            Properties payload matching the database schema
+        """
+        properties = {
+            "Task name": {"title": [{"text": {"content": task.title}}]},
+            "Status": {"status": {"name": STATUS_TO_NOTION.get(task.status, "Not started")}},
+            "Priority": {"select": {"name": PRIORITY_TO_NOTION.get(task.priority, "Medium")}},
+            "Description": {"rich_text": [{"text": {"content": task.description}}]},
+            "Task type": DEFAULT_TASK_TYPE_PROPERTY,
+            "Effort level": DEFAULT_EFFORT_LEVEL_PROPERTY
+        }
+        
+        # Add due date if provided
+        if task.due_date:
+            properties["Due date"] = {"date": {"start": task.due_date.isoformat()}}
+        
+        # Record the source identifier where the database has a column for it
+        if task.source_id and self._has_source_id_property():
+            properties[SOURCE_ID_PROPERTY] = {"rich_text": [{"text": {"content": task.source_id}}]}
+        
+        return properties
+    
+    def _has_source_id_property(self) -> bool:
+        """Whether the database has the optional SOURCE_ID_PROPERTY rich text column."""
+        return self.get_database_schema().get(SOURCE_ID_PROPERTY, {}).get("type") == "rich_text"
+    
     def update_task_status(self, page_id: str, status: TaskStatus) -> bool:
         """
         Update a task's status in Notion.
@@ -306,7 +561,8 @@ class NotionAgent(BaseAgent):
             True if successful, False otherwise
         """
         try:
-            self.client.pages.update(
+            self._request(
+                self.client.pages.update,
                 page_id=page_id,
                 properties={
                     "Status": {
@@ -327,68 +583,116 @@ class NotionAgent(BaseAgent):
         """
         Create multiple tasks in Notion efficiently.
         
+        Up to `settings.notion_concurrency` tasks are created at once, each
+        in a worker thread so the blocking Notion client doesn't stall the
+        event loop.
+        
         Args:
             tasks: List of Task objects to create
             
         Returns:
             List of Notion page IDs (None for failed creations)
         """
-        page_ids = []
         total_tasks = len(tasks)
         self.logger.info(f"🚀 Starting batch creation of {total_tasks} tasks")
         
-        for i, task in enumerate(tasks, 1):
-            try:
-                self.logger.debug(f"Creating task {i}/{total_tasks}: {task.title}")
-                page_id = self.create_task_in_notion(task)
-                page_ids.append(page_id)
-                
-                if page_id:
-                    self.logger.debug(f"✅ Task {i}/{total_tasks} created successfully")
-                else:
-                    self.logger.warning(f"⚠️ Task {i}/{total_tasks} skipped (duplicate or error)")
-                
-                # Small delay to respect rate limits
-                await asyncio.sleep(0.1)
-                
-            except Exception as e:
-                self.logger.error(f"❌ Error creating task {i}/{total_tasks} '{task.title}': {e}")
-                page_ids.append(None)
+        semaphore = asyncio.Semaphore(max(1, settings.notion_concurrency))
+        
+        # Every duplicate check compares against the same recent tasks; fetch them once
+        recent_tasks = await asyncio.to_thread(self._get_recent_tasks_for_dedup)
         
-        successful_creates = len([pid for pid in page_ids if pid is not None])
+        async def create_one(i: int, task: Task, batch_duplicate: bool) -> Optional[str]:
+            if batch_duplicate:
+                self.logger.warning(f"⚠️ Task {i}/{total_tasks} skipped (duplicate within batch)")
+                return None
+            
+            async with semaphore:
+                try:
+                    self.logger.debug("Creating task {}/{}: {}", i, total_tasks, task.title)
+                    page_id = await asyncio.to_thread(self.create_task_in_notion, task, recent_tasks)
+                except Exception as e:
+                    self.logger.error(f"❌ Error creating task {i}/{total_tasks} '{task.title}': {e}")
+                    return None
+            
+            if page_id:
+                self.logger.debug("✅ Task {}/{} created successfully", i, total_tasks)
+            else:
+                self.logger.warning(f"⚠️ Task {i}/{total_tasks} skipped (duplicate or error)")
+            return page_id
+        
+        page_ids = await asyncio.gather(*(
+            create_one(i, task, batch_duplicate)
+            for i, (task, batch_duplicate) in enumerate(zip(tasks, self._find_batch_duplicates(tasks)), 1)
+        ))
+        
+        successful_creates = sum(1 for pid in page_ids if pid is not None)
         self.logger.info(f"📊 Batch creation complete: {successful_creates}/{total_tasks} tasks created successfully")
         
-        return page_ids
+        return list(page_ids)
     
-    def search_tasks_by_source(self, source: str, source_id: str) -> List[Dict[str, Any]]:
+    async def batch_update_status(self, updates: List[Tuple[str, TaskStatus]]) -> List[bool]:
+        """
+        Update the status of several tasks in Notion.
+        
+        Like `batch_create_tasks`, up to `settings.notion_concurrency`
+        updates run at once in worker threads, paced by the shared rate limiter.
+        
+        Args:
+            updates: (Notion page ID, new status) pairs
+            
+        Returns:
+            One success flag per update, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, settings.notion_concurrency))
+        
+        async def update_one(page_id: str, status: TaskStatus) -> bool:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(self.update_task_status, page_id, status)
+                except Exception as e:
+                    self.log_error(e, f"Updating task status: {page_id}")
+                    return False
+        
+        results = await asyncio.gather(*(update_one(page_id, status) for page_id, status in updates))
+        self.logger.info(f"📊 Batch status update complete: {sum(results)}/{len(updates)} tasks updated")
+        return list(results)
+    
+    def search_tasks_by_source(self, source: str, source_id: str,
+                               max_results: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Search for tasks by source and source ID to avoid duplicates.
         
+        When the database has the optional SOURCE_ID_PROPERTY column, the
+        source ID is matched by Notion and only those pages are returned;
+        otherwise every task from `source` is.
+        
         Args:
             source: Source system (email, slack, etc.)
             source_id: Source-specific identifier
+            max_results: Stop after this many pages (None for all matches)
             
         Returns:
             List of matching Notion pages
         """
         try:
-            response = self.client.databases.query(
-                database_id=self.database_id,
-                filter={
-                    "and": [
-                        {
-                            "property": "Source",
-                            "select": {
-                                "equals": source.title()
-                            }
-                        }
-                    ]
+            conditions = [
+                {
+                    "property": "Source",
+                    "select": {
+                        "equals": source.title()
+                    }
                 }
-            )
+            ]
+            if self._has_source_id_property():
+                conditions.append({
+                    "property": SOURCE_ID_PROPERTY,
+                    "rich_text": {
+                        "equals": source_id
+                    }
+                })
             
-            # Filter by source_id in metadata (would need custom property)
-            # For now, return all matching source tasks
-            return response.get("results", [])
+            results = self._query_pages(max_results=max_results, filter={"and": conditions})
+            return list(results)
             
         except APIResponseError as e:
             self.log_error(e, f"Searching tasks by source: {source}")
@@ -398,12 +702,22 @@ class NotionAgent(BaseAgent):
         """
         Get the current database schema for validation.
         
+        Schemas rarely change, so the last fetch is reused for
+        SCHEMA_CACHE_TTL_SECONDS; health checks and repeated validations
+        don't each cost a Notion request.
+        
         Returns:
             Database schema information
         """
+        cached = self._schema_cache
+        if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL_SECONDS:
+            return cached[1]
+        
         try:
-            response = self.client.databases.retrieve(database_id=self.database_id)
-            return response.get("properties", {})
+            response = self._request(self.client.databases.retrieve, database_id=self.database_id)
+            properties = response.get("properties", {})
+            self._schema_cache = (time.monotonic(), properties)
+            return properties
             
         except APIResponseError as e:
             self.log_error(e, "Getting database schema")
@@ -418,23 +732,22 @@ class NotionAgent(BaseAgent):
         """
         try:
             schema = self.get_database_schema()
+            schema_types = {name: prop.get("type") for name, prop in schema.items()}
             
-            # Updated to match your Tasks Tracker database schema with correct property types
-            required_properties = {
-                "Task name": "title",
-                "Status": "status",  # Notion uses "status" type, not "select"
-                "Priority": "select",
-                "Description": "rich_text"
-            }
-            
-            for prop_name, prop_type in required_properties.items():
-                if prop_name not in schema:
-                    self.logger.error(f"Missing required property: {prop_name}")
-                    return False
-                    
-                if schema[prop_name]["type"] != prop_type:
-                    self.logger.error(f"Property {prop_name} has wrong type. Expected {prop_type}, got {schema[prop_name]['type']}")
-                    return False
+            # Report every problem at once rather than stopping at the first
+            missing = [name for name in REQUIRED_PROPERTIES if name not in schema_types]
+            wrong_type = [
+                (name, prop_type, schema_types[name])
+                for name, prop_type in REQUIRED_PROPERTIES.items()
+                if name in schema_types and schema_types[name] != prop_type
+            ]
+            
+            for prop_name in missing:
+                self.logger.error(f"Missing required property: {prop_name}")
+            for prop_name, expected, actual in wrong_type:
+                self.logger.error(f"Property {prop_name} has wrong type. Expected {expected}, got {actual}")
+            if missing or wrong_type:
+                return False
             
             self.logger.info("Database schema validation passed")
             return True
@@ -448,20 +761,19 @@ class NotionAgent(BaseAgent):
         try:
             # Query the database for recent tasks, sorted by creation time
             # Use Notion's built-in created_time instead of "Created time" property
-            response = self.client.databases.query(
-                database_id=self.database_id,
+            results = self._query_pages(
+                max_results=limit,
                 sorts=[
                     {
                         "timestamp": "created_time",
                         "direction": "descending"
                     }
-                ],
-                page_size=limit
+                ]
             )
             
             tasks = []
-            results = response.get("results", [])
-            
+            # Fallback for rows without a creation time, computed once per call
+            default_created = datetime.now().isoformat(timespec="seconds")
             for result in results:
                 try:
                     properties = result.get("properties", {})
@@ -474,7 +786,7 @@ class NotionAgent(BaseAgent):
                         "priority": self._extract_select(properties.get("Priority", {})),
                         "status": self._extract_select(properties.get("Status", {})),
                         "from": self._extract_rich_text(properties.get("From", {})),
-                        "created": self._extract_date(result.get("created_time", ""))
+                        "created": self._extract_date(result.get("created_time", ""), default_created)
                     }
                     tasks.append(task)
                 except Exception as e:
@@ -489,30 +801,20 @@ class NotionAgent(BaseAgent):
     
     def _extract_title(self, title_prop: Dict[str, Any]) -> str:
         """Extract title from Notion title property."""
-        try:
-            return title_prop.get("title", [{}])[0].get("plain_text", "Untitled")
-        except (IndexError, KeyError):
-            return "Untitled"
+        title = title_prop.get("title")
+        return title[0].get("plain_text", "Untitled") if title else "Untitled"
     
     def _extract_rich_text(self, text_prop: Dict[str, Any]) -> str:
         """Extract text from Notion rich text property."""
-        try:
-            return text_prop.get("rich_text", [{}])[0].get("plain_text", "")
-        except (IndexError, KeyError):
-            return ""
+        rich_text = text_prop.get("rich_text")
+        return rich_text[0].get("plain_text", "") if rich_text else ""
     
     def _extract_select(self, select_prop: Dict[str, Any]) -> str:
         """Extract value from Notion select property."""
-        try:
-            return select_prop.get("select", {}).get("name", "")
-        except KeyError:
-            return ""
+        # An unset select is returned as null, so don't rely on the .get() default
+        select = select_prop.get("select")
+        return select.get("name", "") if select else ""
     
-    def _extract_date(self, date_value: str) -> str:
-        """Extract and format date string."""
-        try:
-            if date_value:
-                return date_value
-            return datetime.now().isoformat()
-        except:
-            return datetime.now().isoformat()
+    def _extract_date(self, date_value: str, default: str) -> str:
+        """Extract date string, falling back to `default` when it is missing."""
+        return date_value or default
@@ -0,0 +1,50 @@
+"""
+Client-side rate limiting for the Notion API.
+
+Notion allows an average of about three requests per second per
+integration and answers bursts above that with HTTP 429. Every Notion
+call goes through one shared token bucket so concurrent task creation,
+duplicate checks and dashboard queries stay under the limit together.
+
+Key features:
+- Thread-safe token bucket (Notion calls run in worker threads and API handlers)
+- Callers reserve a slot under the lock and sleep outside it, in arrival order
+- Short bursts allowed up to the bucket capacity
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token bucket limiting how often a shared resource is called.
+
+    `acquire()` blocks the calling thread until it may proceed.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Create a full bucket.
+
+        Args:
+            rate: Sustained calls per second
+            burst: Calls allowed back to back after an idle period
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a call is allowed, then consume one token."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Going negative reserves a future slot for this caller
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
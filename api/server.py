@@ -113,7 +113,10 @@ class WebSocketManager:
         
         # Serialize datetime objects before JSON encoding
         serialized_message = serialize_datetime_dict(message)
-        message_str = json.dumps(serialized_message)
+        await self.broadcast_text(json.dumps(serialized_message))
+    
+    async def broadcast_text(self, message_str: str):
+        """Send an already-encoded JSON message to all connected clients."""
         disconnected = set()
         
         for connection in self.active_connections:
@@ -130,11 +133,10 @@ class WebSocketManager:
     
     async def send_stats_update(self, stats: dict):
         """Send stats update to all clients."""
-        # Serialize stats dict to handle datetime objects
-        serialized_stats = serialize_datetime_dict(stats)
+        # broadcast() serializes datetime objects, so the stats are walked only once
         await self.broadcast({
             "type": "stats_update",
-            "data": serialized_stats,
+            "data": stats,
             "timestamp": datetime.now().isoformat()
         })
     
@@ -146,6 +148,14 @@ class WebSocketManager:
             "timestamp": datetime.now().isoformat()
         })
     
+    async def send_log_batch(self, log_entries: List[dict]):
+        """Send several log entries to all clients in one message."""
+        await self.broadcast({
+            "type": "log_batch",
+            "data": log_entries,
+            "timestamp": datetime.now().isoformat()
+        })
+    
     async def send_task_update(self, task_data: dict):
         """Send task update to all clients."""
         await self.broadcast({
@@ -191,6 +201,15 @@ async def startup_event():
         raise RuntimeError(f"Failed to initialize orchestrator: {e}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the agents' IMAP connection, SQLite handles and Notion HTTP pool."""
+    if orchestrator is None:
+        return
+    orchestrator.email_agent.close()
+    orchestrator.notion_agent.close()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -242,7 +261,7 @@ async def websocket_endpoint(websocket: WebSocket):
             await websocket_manager.send_stats_update(system_stats)
             
             # Send recent logs
-            for log_entry in orchestrator.log_buffer[-10:]:  # Last 10 logs
+            for log_entry in orchestrator.get_recent_logs(10):  # Last 10 logs
                 await websocket_manager.send_log_update(log_entry)
         
         # Keep connection alive and handle incoming messages
@@ -362,7 +381,7 @@ async def get_agents_status():
         # Notion agent status
         if hasattr(orchestrator, 'notion_agent'):
             try:
-                db_valid = orchestrator.notion_agent.validate_database_setup()
+                db_valid = await asyncio.to_thread(orchestrator.notion_agent.validate_database_setup)
                 schema_status = "✅ Valid" if db_valid else "❌ Invalid"
             except:
                 schema_status = "❌ Invalid"
@@ -404,7 +423,7 @@ async def get_api_recent_tasks(limit: int = 10):
         # Get real tasks from Notion database
         if hasattr(orchestrator, 'notion_agent') and orchestrator.notion_agent:
             # Query recent tasks from Notion
-            recent_tasks = orchestrator.notion_agent.get_recent_tasks(limit=limit)
+            recent_tasks = await asyncio.to_thread(orchestrator.notion_agent.get_recent_tasks, limit=limit)
             return recent_tasks
         else:
             # Return empty list if no real tasks yet
@@ -768,9 +787,9 @@ async def switch_model(model_data: dict):
                 message=f"Model {new_model} is not available or not properly configured"
             )
         
-        # Switch the model in the orchestrator
+        # Switch the model in the orchestrator (builds and validates a Notion client, so off the loop)
         old_model = orchestrator.model
-        orchestrator.switch_model(new_model)
+        await asyncio.to_thread(orchestrator.switch_model, new_model)
         
         logger.info(f"Model switched from {old_model} to {new_model}")
         
@@ -804,8 +823,8 @@ async def create_task(task: TaskCreate):
             metadata={"created_via": "api"}
         )
         
-        # Create in Notion
-        page_id = orchestrator.notion_agent.create_task_in_notion(new_task)
+        # Create in Notion (off the event loop; the Notion rate limiter may block)
+        page_id = await asyncio.to_thread(orchestrator.notion_agent.create_task_in_notion, new_task)
         
         if page_id:
             return TaskResponse(
@@ -859,7 +878,7 @@ async def get_notion_agent_status():
         raise HTTPException(status_code=503, detail="System not initialized")
     
     # Check database connectivity
-    db_valid = orchestrator.notion_agent.validate_database_setup()
+    db_valid = await asyncio.to_thread(orchestrator.notion_agent.validate_database_setup)
     
     return {
         "status": "active" if db_valid else "error",
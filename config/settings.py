@@ -27,11 +27,16 @@ class Settings(BaseSettings):
     email_imap_port: int = Field(default=993, description="IMAP port")
     email_check_interval: int = Field(default=300, description="Email check interval in seconds")
     enable_realtime_email: bool = Field(default=True, description="Enable real-time email processing via IMAP IDLE")
+    enable_server_side_filter: bool = Field(default=True, description="Exclude mailing-list and no-reply senders in the IMAP search")
+    enable_header_prefetch: bool = Field(default=True, description="Fetch headers first and download bodies only for new, non-automated emails")
     realtime_fallback_interval: int = Field(default=60, description="Fallback polling interval when IDLE fails")
+    processed_email_retention_days: int = Field(default=30, description="Days to remember processed email IDs (must exceed the polling search window)")
     
     # Notion Settings
     notion_api_key: str = Field(description="Notion integration API key")
     notion_database_id: str = Field(description="Notion database ID for tasks")
+    notion_requests_per_second: float = Field(default=2.5, gt=0, description="Sustained Notion API request rate (Notion allows about 3 per second)")
+    notion_concurrency: int = Field(default=3, description="Maximum number of Notion tasks created concurrently")
     
     # Slack Settings (future)
     slack_bot_token: Optional[str] = Field(default=None, description="Slack bot token")
@@ -43,6 +48,14 @@ class Settings(BaseSettings):
     gemini_api_key: Optional[str] = Field(default=None, description="Google Gemini API key")
     google_api_key: Optional[str] = Field(default=None, description="Google API key (alias for Gemini)")
     default_model: str = Field(default="anthropic:claude-3-5-sonnet-latest", description="Default AI model")
+    enable_model_cascade: bool = Field(default=True, description="Extract with a fast model first and escalate ambiguous results to the selected model")
+    max_extraction_chars: int = Field(default=4000, description="Maximum email content characters sent to the AI model")
+    extraction_batch_size: int = Field(default=10, description="Number of emails sent to the AI model per extraction call")
+    extraction_concurrency: int = Field(default=4, description="Maximum number of concurrent AI extraction calls")
+    enable_extraction_cache: bool = Field(default=True, description="Cache AI task-extraction results for identical emails")
+    extraction_cache_size: int = Field(default=10000, description="Maximum number of cached task-extraction results")
+    enable_semantic_cache: bool = Field(default=False, description="Reuse extraction results for near-duplicate emails (requires sentence-transformers)")
+    semantic_cache_threshold: float = Field(default=0.95, description="Cosine similarity required for a semantic cache hit")
     
     # Application Settings
     log_level: str = Field(default="INFO", description="Logging level")
@@ -110,6 +110,14 @@ export function useRealtimeData(
           });
           break;
           
+        case 'log_batch':
+          setLogs(prevLogs => {
+            const newLogs = [...prevLogs, ...lastMessage.data];
+            // Keep only the latest 50 logs
+            return newLogs.slice(-50);
+          });
+          break;
+          
         case 'task_update':
           setTasks(prevTasks => {
             const newTasks = [lastMessage.data, ...prevTasks];
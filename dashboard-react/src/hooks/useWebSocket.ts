@@ -1,7 +1,7 @@
 import { useEffect, useRef, useState, useCallback } from 'react';
 
 interface WebSocketMessage {
-  type: 'stats_update' | 'log_update' | 'task_update';
+  type: 'stats_update' | 'log_update' | 'log_batch' | 'task_update';
   data: any;
   timestamp: string;
 }
@@ -57,8 +57,8 @@ def check_system_requirements():
     
     # Check Python version
     python_version = sys.version_info
-    if python_version < (3, 8):
-        print_error(f"Python 3.8+ required, found {python_version.major}.{python_version.minor}")
+    if python_version < (3, 9):
+        print_error(f"Python 3.9+ required, found {python_version.major}.{python_version.minor}")
         print_info("Please upgrade Python: https://www.python.org/downloads/")
         return False
     print_success(f"Python {python_version.major}.{python_version.minor}.{python_version.micro} ✓")
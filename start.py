@@ -12,12 +12,12 @@ Usage:
     python start.py                    # Starts complete system
 
 Works on:
-- Windows (with Node.js 18+ and Python 3.8+ installed)
-- Linux (with Node.js 18+ and Python 3.8+ installed)  
-- macOS (with Node.js 18+ and Python 3.8+ installed)
+- Windows (with Node.js 18+ and Python 3.9+ installed)
+- Linux (with Node.js 18+ and Python 3.9+ installed)  
+- macOS (with Node.js 18+ and Python 3.9+ installed)
 
 Requirements:
-- Python 3.8+ with packages from requirements.txt
+- Python 3.9+ with packages from requirements.txt
 - Node.js 18+ and npm 8+
 - React dashboard dependencies installed (npm install in dashboard-react/)
 
@@ -352,8 +352,8 @@ class SystemLauncher:
         
         # Check Python version
         python_version = sys.version_info
-        if python_version < (3, 8):
-            logger.error(f"[ERROR] Python 3.8+ required, found {python_version.major}.{python_version.minor}")
+        if python_version < (3, 9):
+            logger.error(f"[ERROR] Python 3.9+ required, found {python_version.major}.{python_version.minor}")
             return False
         
         logger.info(f"[OK] Python: {python_version.major}.{python_version.minor}.{python_version.micro}")
@@ -363,7 +363,6 @@ class SystemLauncher:
             'fastapi',
             'uvicorn',
             'loguru',
-            'schedule',
             'requests'
         ]
         
@@ -0,0 +1,24 @@
+"""
+Shared pytest setup for AI Agents Swarm.
+
+Makes the repository importable from the tests and provides dummy
+values for the required settings so modules that read `settings` at
+import time can be loaded without a `.env` file.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# Required settings without defaults; real values are never contacted in tests
+for name, value in {
+    "EMAIL_ADDRESS": "tests@example.com",
+    "EMAIL_PASSWORD": "test-password",
+    "NOTION_API_KEY": "secret_test",
+    "NOTION_DATABASE_ID": "test-database",
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,85 @@
+"""Tests for EmailAgent._fetch_sections, the batched IMAP FETCH response parser."""
+
+import pytest
+from loguru import logger
+
+from agents.email_polling import FETCH_ITEMS, HEADER_FETCH_ITEMS, EmailAgent
+
+
+class FakeMail:
+    """IMAP connection stand-in returning a canned UID FETCH response."""
+
+    def __init__(self, status, msg_data):
+        self.status = status
+        self.msg_data = msg_data
+        self.commands = []
+
+    def uid(self, command, *args):
+        self.commands.append((command,) + args)
+        return self.status, self.msg_data
+
+
+@pytest.fixture
+def agent():
+    # Skip __init__, which would open the stores and configure IMAP
+    agent = EmailAgent.__new__(EmailAgent)
+    agent.logger = logger
+    return agent
+
+
+def test_headers_and_text_are_grouped_per_uid(agent):
+    mail = FakeMail("OK", [
+        (b"1 (UID 101 BODY[HEADER] {20}", b"Subject: first\r\n\r\n"),
+        (b" BODY[TEXT]<0> {5}", b"body1"),
+        b")",
+        (b"2 (UID 102 BODY[HEADER] {21}", b"Subject: second\r\n\r\n"),
+        (b" BODY[TEXT]<0> {5}", b"body2"),
+        b")",
+    ])
+
+    sections = agent._fetch_sections(mail, [b"101", b"102"], FETCH_ITEMS)
+
+    assert sections == {
+        b"101": (b"Subject: first\r\n\r\n", b"body1"),
+        b"102": (b"Subject: second\r\n\r\n", b"body2"),
+    }
+    assert mail.commands == [("FETCH", "101,102", FETCH_ITEMS)]
+
+
+def test_uid_reported_after_the_literal(agent):
+    # Some servers send the UID item after the body literals
+    mail = FakeMail("OK", [
+        (b"7 (BODY[HEADER] {12}", b"Subject: x\r\n"),
+        (b" BODY[TEXT]<0> {4}", b"text"),
+        b" UID 555)",
+    ])
+
+    sections = agent._fetch_sections(mail, [b"555"], FETCH_ITEMS)
+
+    assert sections == {b"555": (b"Subject: x\r\n", b"text")}
+
+
+def test_header_only_fetch_leaves_text_empty(agent):
+    mail = FakeMail("OK", [
+        (b"3 (UID 42 BODY[HEADER.FIELDS (SUBJECT FROM)] {12}", b"Subject: y\r\n"),
+        b")",
+    ])
+
+    sections = agent._fetch_sections(mail, [b"42"], HEADER_FETCH_ITEMS)
+
+    assert sections == {b"42": (b"Subject: y\r\n", b"")}
+
+
+def test_messages_without_uid_are_dropped(agent):
+    mail = FakeMail("OK", [
+        (b"1 (BODY[HEADER] {12}", b"Subject: z\r\n"),
+        b")",
+    ])
+
+    assert agent._fetch_sections(mail, [b"9"], FETCH_ITEMS) == {}
+
+
+def test_failed_fetch_returns_nothing(agent):
+    mail = FakeMail("NO", [None])
+
+    assert agent._fetch_sections(mail, [b"1"], FETCH_ITEMS) == {}
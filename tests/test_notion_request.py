@@ -0,0 +1,103 @@
+"""Tests for NotionAgent._request: shared rate limiting and HTTP 429 retries."""
+
+import httpx
+import pytest
+from loguru import logger
+from notion_client.errors import APIErrorCode, APIResponseError
+
+import agents.notion_integration as notion_integration
+from agents.notion_integration import NOTION_MAX_RETRIES, NotionAgent
+from agents.notion_integration.rate_limiter import RateLimiter
+
+
+def api_error(status: int, headers=None) -> APIResponseError:
+    """Build the error notion-client raises for a failed response."""
+    response = httpx.Response(
+        status,
+        headers=headers or {},
+        request=httpx.Request("POST", "https://api.notion.com/v1/pages")
+    )
+    code = APIErrorCode.RateLimited if status == 429 else APIErrorCode.ValidationError
+    return APIResponseError(response, "stubbed error", code)
+
+
+class FlakyEndpoint:
+    """Notion endpoint stand-in raising the given errors before succeeding."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"id": "page-id"}
+
+
+@pytest.fixture
+def agent():
+    # Skip __init__, which would connect to Notion
+    agent = NotionAgent.__new__(NotionAgent)
+    agent.logger = logger
+    return agent
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(notion_integration.time, "sleep", sleeps.append)
+    # A generous bucket so the limiter itself never waits in these tests
+    monkeypatch.setattr(notion_integration, "NOTION_RATE_LIMITER", RateLimiter(rate=1000.0, burst=100))
+    return sleeps
+
+
+def test_success_is_returned_without_retry(agent, sleeps):
+    endpoint = FlakyEndpoint()
+
+    assert agent._request(endpoint, database_id="db") == {"id": "page-id"}
+    assert endpoint.calls == [{"database_id": "db"}]
+    assert sleeps == []
+
+
+def test_429_waits_for_retry_after(agent, sleeps):
+    endpoint = FlakyEndpoint(api_error(429, {"Retry-After": "2"}), api_error(429, {"Retry-After": "0.5"}))
+
+    assert agent._request(endpoint) == {"id": "page-id"}
+    assert len(endpoint.calls) == 3
+    assert sleeps == [2.0, 0.5]
+
+
+def test_429_without_retry_after_backs_off_exponentially(agent, sleeps):
+    endpoint = FlakyEndpoint(api_error(429), api_error(429), api_error(429))
+
+    assert agent._request(endpoint) == {"id": "page-id"}
+    assert sleeps == [1, 2, 4]
+
+
+def test_429_gives_up_after_max_retries(agent, sleeps):
+    endpoint = FlakyEndpoint(*(api_error(429) for _ in range(NOTION_MAX_RETRIES + 1)))
+
+    with pytest.raises(APIResponseError):
+        agent._request(endpoint)
+    assert len(endpoint.calls) == NOTION_MAX_RETRIES + 1
+    assert len(sleeps) == NOTION_MAX_RETRIES
+
+
+def test_other_errors_are_not_retried(agent, sleeps):
+    endpoint = FlakyEndpoint(api_error(400))
+
+    with pytest.raises(APIResponseError):
+        agent._request(endpoint)
+    assert len(endpoint.calls) == 1
+    assert sleeps == []
+
+
+def test_every_attempt_goes_through_the_shared_limiter(agent, sleeps, monkeypatch):
+    acquired = []
+    monkeypatch.setattr(notion_integration.NOTION_RATE_LIMITER, "acquire", lambda: acquired.append(1))
+    endpoint = FlakyEndpoint(api_error(429, {"Retry-After": "1"}))
+
+    agent._request(endpoint)
+
+    assert len(acquired) == 2
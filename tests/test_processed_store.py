@@ -0,0 +1,79 @@
+"""Tests for the SQLite-backed processed email store and its Bloom filter."""
+
+import time
+
+import pytest
+
+from agents.email_polling import processed_store
+from agents.email_polling.processed_store import ProcessedEmailStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ProcessedEmailStore(
+        db_path=tmp_path / "processed.sqlite",
+        legacy_pickle=tmp_path / "processed.pkl"
+    )
+    yield store
+    store.close()
+
+
+def test_contains_after_rebuild(store):
+    store.update(f"<msg-{i}@example.com>" for i in range(50))
+
+    store._rebuild_bloom()
+
+    assert all(f"<msg-{i}@example.com>" in store for i in range(50))
+    assert "<unknown@example.com>" not in store
+    assert len(store) == 50
+
+
+def test_contains_after_growth(store):
+    # A tiny filter overflows after a few inserts and is rebuilt larger
+    store._rebuild_bloom(min_capacity=1)
+    small_capacity = store._bloom.capacity
+
+    for i in range(10):
+        store.add(f"<msg-{i}@example.com>")
+
+    assert store._bloom.capacity > small_capacity
+    assert all(f"<msg-{i}@example.com>" in store for i in range(10))
+
+
+def test_rebuild_keeps_old_filter_until_populated(store, monkeypatch):
+    store.update(["<a@example.com>", "<b@example.com>"])
+    seen_during_rebuild = []
+    original_add = processed_store.BloomFilter.add
+
+    def add_and_probe(bloom, item):
+        # Lookups take the lock only after the filter says "maybe", so probe the filter directly
+        seen_during_rebuild.append("<a@example.com>" in store._bloom)
+        original_add(bloom, item)
+
+    monkeypatch.setattr(processed_store.BloomFilter, "add", add_and_probe)
+    store._rebuild_bloom()
+
+    assert seen_during_rebuild and all(seen_during_rebuild)
+
+
+def test_prune_removes_only_old_entries(store):
+    store.update(["<old@example.com>", "<new@example.com>"])
+    two_days_ago = int(time.time()) - 2 * 86400
+    store._conn.execute(
+        "UPDATE processed SET processed_at = ? WHERE msg_id = ?", (two_days_ago, "<old@example.com>")
+    )
+    store._conn.commit()
+
+    removed = store.prune(max_age_seconds=86400)
+
+    assert removed == 1
+    assert "<old@example.com>" not in store
+    assert "<new@example.com>" in store
+    assert len(store) == 1
+
+
+def test_prune_without_old_entries_keeps_everything(store):
+    store.update(["<a@example.com>", "<b@example.com>"])
+
+    assert store.prune(max_age_seconds=86400) == 0
+    assert len(store) == 2
@@ -0,0 +1,69 @@
+"""Tests for the Notion token-bucket rate limiter."""
+
+import pytest
+
+from agents.notion_integration import rate_limiter
+from agents.notion_integration.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Monotonic clock that only advances when told to (or when slept on)."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limiter.time, "sleep", clock.sleep)
+    return clock
+
+
+def test_burst_passes_without_waiting(clock):
+    limiter = RateLimiter(rate=2.0, burst=3)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_calls_beyond_burst_are_paced_at_the_rate(clock):
+    limiter = RateLimiter(rate=2.0, burst=1)
+
+    for _ in range(4):
+        limiter.acquire()
+
+    assert clock.sleeps == pytest.approx([0.5, 0.5, 0.5])
+
+
+def test_tokens_refill_while_idle(clock):
+    limiter = RateLimiter(rate=2.0, burst=2)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now += 1.0  # Enough to refill both tokens
+    limiter.acquire()
+    limiter.acquire()
+
+    assert clock.sleeps == []
+
+
+def test_refill_is_capped_at_burst(clock):
+    limiter = RateLimiter(rate=2.0, burst=2)
+
+    clock.now += 60.0  # A long idle period must not bank more than `burst` tokens
+    for _ in range(3):
+        limiter.acquire()
+
+    assert clock.sleeps == pytest.approx([0.5])